@@ -1,6 +1,7 @@
 # config.py - User configuration management
 import configparser
 import os
+import tempfile
 from pathlib import Path
 from backend.file_paths import get_config_file
 
@@ -53,10 +54,19 @@ def load_config():
     return config
 
 def save_config(config):
-    """Save configuration to config.ini"""
+    """Save configuration to config.ini (atomically: temp file, then replace)"""
     config_path = get_config_path()
-    with open(config_path, 'w') as f:
-        config.write(f)
+    fd, tmp_path = tempfile.mkstemp(dir=config_path.parent, prefix=config_path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            config.write(f)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 def get_user_callsign():
     """Get user's callsign from config"""
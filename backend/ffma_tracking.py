@@ -6,14 +6,23 @@ Parses LoTW ADIF file to find confirmed 6m QSOs with grid squares
 
 from pathlib import Path
 import json
+import re
 from datetime import datetime
 import sys
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional - stdlib json fallback
+    from json import loads as _json_loads
+
 from backend.file_paths import get_ffma_grids_file, get_ffma_data_file
 
 # Official 488 FFMA grids (extracted from ARRL LOTW)
 FFMA_GRIDS = None  # Loaded from ffma_grids.json
 
+# ADIF <FIELD:LENGTH[:TYPE]>VALUE
+_ADIF_FIELD_RE = re.compile(r'<([^:>]+):(\d+)(?::([^>]+))?>([^<]*)')
+
 def load_ffma_grids():
     """Load the official 488 FFMA grids"""
     global FFMA_GRIDS
@@ -27,7 +36,7 @@ def load_ffma_grids():
     if grids_file.exists():
         try:
             #FFMA_GRIDS = set(json.loads(grids_file.read_text()))
-            data = json.loads(grids_file.read_text())
+            data = _json_loads(grids_file.read_bytes())
             FFMA_GRIDS = set(data)
             print(f"Loaded {len(FFMA_GRIDS)} FFMA grids")
             return FFMA_GRIDS
@@ -61,13 +70,8 @@ def is_ffma_grid(grid):
     return normalized in grids if normalized else False
 
 
-def parse_lotw_adif_for_ffma(adif_file_path, home_grid=None):
-    """
-    Parse LoTW ADIF file for 6m confirmations with grids
-    Returns dict: {grid: {"call": callsign, "date": qso_date}}
-    """
-    
-    # Get home grid from config if not provided
+def _resolve_home_grid(home_grid=None):
+    """Get home grid (from config if not provided), normalized to 4 characters"""
     if home_grid is None:
         try:
             from backend.config import get_user_grid
@@ -81,45 +85,59 @@ def parse_lotw_adif_for_ffma(adif_file_path, home_grid=None):
         home_grid = home_grid.strip().upper()[:4]
         print(f"Filtering FFMA QSOs to only those from home grid: {home_grid}")
     
-    adif_path = Path(adif_file_path)
-    if not adif_path.exists():
-        print(f"ADIF file not found: {adif_file_path}")
-        return {}
-    
-    print(f"Parsing {adif_file_path} for FFMA (6m grids)...")
-    
-    try:
-        text = adif_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception as e:
-        print(f"Error reading ADIF file: {e}")
-        return {}
+    return home_grid
+
+
+class FFMAAdifParser:
+    """
+    Incremental LoTW ADIF parser for FFMA grids
+    Text can be fed in chunks as it arrives; only complete <EOR> records are parsed.
+    Call close() to get dict: {grid: {"call": callsign, "date": qso_date}}
+    """
     
-    # Load FFMA grids
-    ffma_grids = load_ffma_grids()
+    def __init__(self, home_grid=None):
+        self.home_grid = home_grid
+        self.ffma_grids = load_ffma_grids()
+        self.worked_grids = {}
+        self.skipped_other_grids = 0
+        self._pending = ""
     
-    # Parse ADIF records
-    worked_grids = {}
-    skipped_other_grids = 0
+    def feed(self, text):
+        """Add ADIF text; parse every record completed so far"""
+        self._pending += text.upper()
+        
+        # Keep the (possibly partial) tail after the last <EOR> for the next chunk
+        records = self._pending.split('<EOR>')
+        self._pending = records.pop()
+        
+        for record in records:
+            self._process_record(record)
     
-    # Split by <EOR> or <eor>
-    records = text.upper().split('<EOR>')
+    def close(self):
+        """Parse any remaining text and return worked grids"""
+        if self._pending:
+            self._process_record(self._pending)
+            self._pending = ""
+        
+        if self.home_grid and self.skipped_other_grids > 0:
+            print(f"Skipped {self.skipped_other_grids} QSOs from other grids (not {self.home_grid})")
+        
+        print(f"Found {len(self.worked_grids)} FFMA grids worked on 6m from {self.home_grid if self.home_grid else 'all grids'}")
+        
+        return self.worked_grids
     
-    for record in records:
+    def _process_record(self, record):
         if not record.strip():
-            continue
+            return
+        
+        home_grid = self.home_grid
+        worked_grids = self.worked_grids
         
         # Extract fields
         fields = {}
         
         # Find all <FIELD:LENGTH>VALUE patterns
-        import re
-        matches = re.findall(r'<([^:>]+):(\d+)(?::([^>]+))?>([^<]*)', record)
-        
-        #for match in matches:
-        #    field_name = match[0].strip()
-        #    field_len = int(match[1])
-        #    field_value = match[3][:field_len] if len(match[3]) >= field_len else match[3]
-        #    fields[field_name] = field_value.strip()
+        matches = _ADIF_FIELD_RE.findall(record)
         
         for match in matches:
             field_name = match[0].strip()
@@ -137,18 +155,17 @@ def parse_lotw_adif_for_ffma(adif_file_path, home_grid=None):
         
         # Only process 6m QSOs
         if band != '6M':
-            continue
+            return
         
         # Filter by home grid if specified  # ADD THESE LINES
         if home_grid and my_grid:
             my_grid_4char = my_grid[:4] if len(my_grid) >= 4 else my_grid
-            #print(f"DEBUG: Comparing '{my_grid_4char}' == '{home_grid}': {my_grid_4char == home_grid}")
             # DEBUG - log first 10 filtered QSOs to see what's happening
-            if skipped_other_grids < 10:
+            if self.skipped_other_grids < 10:
                 print(f"DEBUG: Skipping QSO - MY_GRIDSQUARE={my_grid_4char}, HOME={home_grid}, CALL={call}, THEIR_GRID={grid}")
             if my_grid_4char != home_grid:
-                skipped_other_grids += 1
-                continue
+                self.skipped_other_grids += 1
+                return
         
         # Parse date (YYYYMMDD format) - do this BEFORE grid processing
         try:
@@ -178,7 +195,7 @@ def parse_lotw_adif_for_ffma(adif_file_path, home_grid=None):
                 continue
             
             # Check if it's an FFMA grid
-            if norm_grid not in ffma_grids:
+            if norm_grid not in self.ffma_grids:
                 continue
             
             # DEBUG - log first 10 accepted grids
@@ -191,13 +208,32 @@ def parse_lotw_adif_for_ffma(adif_file_path, home_grid=None):
                     "call": call,
                     "date": date_str,
                 }
+
+
+def parse_lotw_adif_for_ffma(adif_file_path, home_grid=None):
+    """
+    Parse LoTW ADIF file for 6m confirmations with grids
+    Returns dict: {grid: {"call": callsign, "date": qso_date}}
+    """
     
-    if home_grid and skipped_other_grids > 0:
-        print(f"Skipped {skipped_other_grids} QSOs from other grids (not {home_grid})")
+    home_grid = _resolve_home_grid(home_grid)
     
-    print(f"Found {len(worked_grids)} FFMA grids worked on 6m from {home_grid if home_grid else 'all grids'}")
+    adif_path = Path(adif_file_path)
+    if not adif_path.exists():
+        print(f"ADIF file not found: {adif_file_path}")
+        return {}
+    
+    print(f"Parsing {adif_file_path} for FFMA (6m grids)...")
+    
+    try:
+        text = adif_path.read_text(encoding='utf-8', errors='ignore')
+    except Exception as e:
+        print(f"Error reading ADIF file: {e}")
+        return {}
     
-    return worked_grids
+    parser = FFMAAdifParser(home_grid)
+    parser.feed(text)
+    return parser.close()
 
 
 def is_grid_worked(grid):
@@ -207,7 +243,7 @@ def is_grid_worked(grid):
         data_file = get_ffma_data_file()
         if data_file.exists():
             try:
-                data = json.loads(data_file.read_text())
+                data = _json_loads(data_file.read_bytes())
                 is_grid_worked._cache = set(data.get("worked_grids", {}).keys())
             except:
                 is_grid_worked._cache = set()
@@ -254,7 +290,7 @@ def get_ffma_stats():
     data_file = get_ffma_data_file()
     if data_file.exists():
         try:
-            return json.loads(data_file.read_text())
+            return _json_loads(data_file.read_bytes())
         except:
             pass
     
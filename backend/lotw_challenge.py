@@ -132,27 +132,18 @@ def download_challenge_qsos(username, password, since_date=None, start_date=None
         return False, f"Network error: {str(e)}"
 
 
-def parse_challenge_adif(adif_text, existing_data=None):
+def collect_challenge_pairs(adif_text, confirmed_pairs, credited_pairs):
     """
-    Parse ADIF text and extract Challenge data (all bands including 60m)
-    Tracks BOTH confirmed (QSL_RCVD=Y) and credited (CREDIT_GRANTED) slots
+    Add the (band, dxcc) pairs from ADIF text to the given sets
     
     Args:
-        adif_text: ADIF format text
-        existing_data: Optional existing challenge data for incremental update
+        adif_text: ADIF format text (complete records)
+        confirmed_pairs: set updated with QSL_RCVD=Y pairs
+        credited_pairs: set updated with CREDIT_GRANTED pairs
         
     Returns:
-        dict: Challenge statistics with both confirmed and credited data
+        tuple: (new confirmed pairs, new credited pairs) added by this text
     """
-    
-    # Start with existing data or empty
-    if existing_data:
-        confirmed_pairs = set(tuple(pair) for pair in existing_data.get("raw_band_entity_pairs", []))
-        credited_pairs = set(tuple(pair) for pair in existing_data.get("credited_band_entity_pairs", []))
-    else:
-        confirmed_pairs = set()
-        credited_pairs = set()
-    
     # Parse ADIF records
     # Split by <eor> or <EOR>
     records = re.split(r'<eor>|<EOR>', adif_text, flags=re.IGNORECASE)
@@ -223,11 +214,16 @@ def parse_challenge_adif(adif_text, existing_data=None):
                 new_credited += 1
             credited_pairs.add(pair)
     
-    print(f"Found {new_confirmed} new confirmed band/entity pairs")
-    print(f"Found {new_credited} new credited band/entity pairs")
-    print(f"Total confirmed pairs: {len(confirmed_pairs)}")
-    print(f"Total credited pairs: {len(credited_pairs)}")
+    return new_confirmed, new_credited
+
+
+def build_challenge_result(confirmed_pairs, credited_pairs):
+    """
+    Build the Challenge statistics dict from confirmed/credited pair sets
     
+    Returns:
+        dict: Challenge statistics with both confirmed and credited data
+    """
     # Count entities by band for CONFIRMED
     confirmed_entities_by_band = {}
     confirmed_unique_entities = set()
@@ -271,6 +267,38 @@ def parse_challenge_adif(adif_text, existing_data=None):
     
     return result
 
+
+def parse_challenge_adif(adif_text, existing_data=None):
+    """
+    Parse ADIF text and extract Challenge data (all bands including 60m)
+    Tracks BOTH confirmed (QSL_RCVD=Y) and credited (CREDIT_GRANTED) slots
+    
+    Args:
+        adif_text: ADIF format text
+        existing_data: Optional existing challenge data for incremental update
+        
+    Returns:
+        dict: Challenge statistics with both confirmed and credited data
+    """
+    
+    # Start with existing data or empty
+    if existing_data:
+        confirmed_pairs = set(tuple(pair) for pair in existing_data.get("raw_band_entity_pairs", []))
+        credited_pairs = set(tuple(pair) for pair in existing_data.get("credited_band_entity_pairs", []))
+    else:
+        confirmed_pairs = set()
+        credited_pairs = set()
+    
+    new_confirmed, new_credited = collect_challenge_pairs(adif_text, confirmed_pairs, credited_pairs)
+    
+    print(f"Found {new_confirmed} new confirmed band/entity pairs")
+    print(f"Found {new_credited} new credited band/entity pairs")
+    print(f"Total confirmed pairs: {len(confirmed_pairs)}")
+    print(f"Total credited pairs: {len(credited_pairs)}")
+    
+    return build_challenge_result(confirmed_pairs, credited_pairs)
+
+
 def save_challenge_data(data, filename=None):    
     """Save challenge data to JSON file"""
     if filename is None:
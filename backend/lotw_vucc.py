@@ -7,12 +7,21 @@ Uses LoTW API to get ADIF file with gridsquare confirmations
 import requests
 from pathlib import Path
 from datetime import datetime
+import json
 from urllib.parse import urlencode
+import codecs
+import re
+import queue
+import threading
 import time
 
 from backend.file_paths import get_user_data_directory
 
-def download_vucc_qsos(username, password, band="6m", since_date=None, progress_callback=None):
+# End of the ADIF header - incremental downloads are appended without it
+_EOH_RE = re.compile(r'<eoh>', re.IGNORECASE)
+
+def download_vucc_qsos(username, password, band="6m", since_date=None, progress_callback=None,
+                       chunk_queue=None):
     """
     Download confirmed QSOs from LoTW for a specific band
     
@@ -22,6 +31,8 @@ def download_vucc_qsos(username, password, band="6m", since_date=None, progress_
         band: Band to download (e.g., "6m", "2m", "70cm")
         since_date: Optional - only download QSOs confirmed after this date (YYYY-MM-DD)
         progress_callback: Optional function(message: str) to report progress
+        chunk_queue: Optional queue.Queue - each downloaded chunk (bytes) is also
+                     put here so a consumer can parse while the download runs
     
     Returns:
         tuple: (success: bool, adif_text: str or error_message: str)
@@ -73,6 +84,8 @@ def download_vucc_qsos(username, password, band="6m", since_date=None, progress_
         for chunk in response.iter_content(chunk_size=8192):
             if chunk:
                 chunks.append(chunk)
+                if chunk_queue is not None:
+                    chunk_queue.put(chunk)
                 downloaded_bytes += len(chunk)
                 
                 # Update progress every 100KB
@@ -105,6 +118,10 @@ def download_vucc_qsos(username, password, band="6m", since_date=None, progress_
         if '<html' in text.lower() or 'login' in text.lower()[:200]:
             return False, "Authentication failed - check username/password"
         
+        # Incremental pull with no new QSLs is just the ADIF header
+        if since_date and '<EOH>' in text.upper():
+            return True, text
+        
         # Check if we got ADIF data
         if '<CALL:' not in text.upper() and '<EOR>' not in text.upper():
             return False, "No data returned - check credentials or band"
@@ -130,39 +147,117 @@ def save_vucc_adif(adif_text, filename="vucc_6m.adi"):
         return False
 
 
-def download_and_parse_ffma(username, password, progress_callback=None):
+def _ffma_parse_worker(chunk_queue, home_grid, result):
+    """Parse ADIF chunks from chunk_queue until a None sentinel arrives"""
+    try:
+        from backend.ffma_tracking import FFMAAdifParser
+        
+        parser = FFMAAdifParser(home_grid)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        
+        while True:
+            chunk = chunk_queue.get()
+            if chunk is None:
+                break
+            parser.feed(decoder.decode(chunk))
+        
+        parser.feed(decoder.decode(b'', final=True))
+        result["worked_grids"] = parser.close()
+        
+    except Exception as e:
+        result["error"] = e
+
+
+def download_and_parse_ffma(username, password, since_date=None, progress_callback=None):
     """
     Download 6m VUCC data and parse for FFMA grids
     
+    The ADIF is parsed on a worker thread as chunks arrive, so parsing
+    overlaps the download instead of re-reading the saved file afterwards.
+    
     Args:
         username: LoTW username
         password: LoTW password
+        since_date: Optional YYYY-MM-DD for incremental update - only QSLs
+                    since then are downloaded and merged into saved FFMA data
         progress_callback: Optional function to report progress
     
     Returns:
         tuple: (success: bool, worked_grids: dict or error_message: str)
     """
     
+    from backend.ffma_tracking import _resolve_home_grid, save_ffma_data
+    from backend.file_paths import get_ffma_data_file
+    
+    # Load existing data for incremental update
+    existing_grids = {}
+    if since_date:
+        try:
+            existing = json.loads(get_ffma_data_file().read_text())
+            existing_grids = existing.get("worked_grids", {})
+            print(f"Loaded existing FFMA data: {len(existing_grids)} grids")
+        except Exception:
+            print("Could not load existing FFMA data, doing full download")
+            since_date = None
+    
+    # Start parser before the download so it can consume chunks as they arrive
+    chunk_queue = queue.Queue()
+    parse_result = {}
+    worker = threading.Thread(
+        target=_ffma_parse_worker,
+        args=(chunk_queue, _resolve_home_grid(), parse_result),
+        daemon=True,
+    )
+    worker.start()
+    
     # Download 6m confirmations
-    success, result = download_vucc_qsos(username, password, band="6m", progress_callback=progress_callback)
+    try:
+        success, result = download_vucc_qsos(username, password, band="6m",
+                                             since_date=since_date,
+                                             progress_callback=progress_callback,
+                                             chunk_queue=chunk_queue)
+    finally:
+        chunk_queue.put(None)
     
     if not success:
+        worker.join()
         return False, result
     
-    # Save ADIF to user data directory
+    # Save ADIF to user data directory - a full download replaces the file,
+    # a delta only adds its records so the file stays complete (compare_ffma
+    # reads it)
     adif_file = get_user_data_directory() / "vucc_6m.adi"
-    adif_file.write_text(result, encoding='utf-8')
-    print(f"Saved to {adif_file}")
+    if not since_date:
+        adif_file.write_text(result, encoding='utf-8')
+        print(f"Saved to {adif_file}")
+    elif adif_file.exists():
+        eoh = _EOH_RE.search(result)
+        records = result[eoh.end():] if eoh else result
+        with open(adif_file, 'a', encoding='utf-8') as f:
+            f.write(records)
+        print(f"Appended new records to {adif_file}")
+    else:
+        print(f"{adif_file} not found - not saving a partial (incremental) ADIF")
     
-    # Parse for FFMA grids
+    # Wait for parser to finish the tail of the download
     if progress_callback:
         progress_callback("Parsing FFMA grids...")
         time.sleep(0.5)
     
-    from backend.ffma_tracking import parse_lotw_adif_for_ffma, save_ffma_data
+    worker.join()
     
     try:
-        worked_grids = parse_lotw_adif_for_ffma(str(adif_file))
+        if "error" in parse_result:
+            raise parse_result["error"]
+        
+        worked_grids = parse_result["worked_grids"]
+        
+        # Merge new confirmations into existing grids (keep earliest QSO)
+        if existing_grids:
+            new_count = len(worked_grids.keys() - existing_grids.keys())
+            print(f"Incremental update: {new_count} new FFMA grids")
+            worked_grids = {**worked_grids, **existing_grids}
+        
         ffma_data = save_ffma_data(worked_grids)
         
         if progress_callback:
@@ -1,8 +1,20 @@
 # Simple page-level pubsub bridge between backend tasks and UI.
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.app_logging import get_logger
+
+logger = get_logger(__name__)
+
 _page = None
 _callback = None
 
+# UI callbacks run here so publishers are not held up by UI work.
+# A single worker keeps messages in publish order (status, spots, ...).
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="msgbus")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
 def init_pubsub(page):
     """Call once from run.py before building MainUI."""
     global _page
@@ -25,7 +37,13 @@ def publish(msg: dict):
     if _page and hasattr(_page, "pubsub") and _page.pubsub:
         _page.pubsub.send_all(msg)
 
+def _log_callback_error(fut):
+    """Done-callback: nobody waits on the futures, so report UI callback errors here."""
+    exc = fut.exception()
+    if exc is not None:
+        logger.error("UI callback failed", exc_info=exc)
+
 def _dispatch(msg):
-    """Deliver messages from pubsub to the UI callback."""
+    """Deliver messages from pubsub to the UI callback (on the bus worker)."""
     if _callback:
-        _callback(msg)
+        _EXECUTOR.submit(_callback, msg).add_done_callback(_log_callback_error)
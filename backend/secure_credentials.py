@@ -12,7 +12,7 @@ import json
 from pathlib import Path
 from cryptography.fernet import Fernet
 import base64
-import hashlib
+import functools
 
 KEYRING_SERVICE = "N4LR_DXClient"
 KEYRING_USERNAME_KEY = "lotw_username"
@@ -21,37 +21,46 @@ FALLBACK_FILE = Path("lotw_credentials.enc")
 KEY_FILE = Path(".credential_key")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_encryption_key():
-    """Get or create encryption key for fallback file storage"""
-    if KEY_FILE.exists():
+    """Get or create encryption key for fallback file storage
+
+    The key is derived (scrypt) only when the key file is first created;
+    after that it is read from disk once and cached for the process.
+    """
+    try:
         return KEY_FILE.read_bytes()
-    else:
+    except FileNotFoundError:
         # Generate key from machine-specific data
         import platform
         import getpass
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
         
         # Combine machine name + username for unique key per machine/user
         unique_string = f"{platform.node()}{getpass.getuser()}N4LR_DXClient_v1"
-        key = hashlib.sha256(unique_string.encode()).digest()
+        kdf = Scrypt(salt=platform.node().encode(), length=32, n=2**14, r=8, p=1)
+        key = kdf.derive(unique_string.encode())
         key_encoded = base64.urlsafe_b64encode(key)
         
         KEY_FILE.write_bytes(key_encoded)
         return key_encoded
 
 
+@functools.lru_cache(maxsize=1)
+def _get_fernet():
+    """Fernet instance for the fallback key (built once per process)"""
+    return Fernet(_get_encryption_key())
+
+
 def _encrypt_data(data):
     """Encrypt data using Fernet"""
-    key = _get_encryption_key()
-    f = Fernet(key)
-    return f.encrypt(data.encode()).decode()
+    return _get_fernet().encrypt(data.encode()).decode()
 
 
 def _decrypt_data(encrypted):
     """Decrypt data using Fernet"""
     try:
-        key = _get_encryption_key()
-        f = Fernet(key)
-        return f.decrypt(encrypted.encode()).decode()
+        return _get_fernet().decrypt(encrypted.encode()).decode()
     except:
         return None
 
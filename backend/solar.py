@@ -6,14 +6,25 @@ Currently displays: SFI, A-index, K-index
 Future expansion ready for: X-ray, sunspots, aurora, band conditions, etc.
 """
 
+import re
 import requests
-import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Dict, Optional
 
+from backend.app_logging import get_logger
+
+logger = get_logger(__name__)
+
 # N0NBH Solar XML feed
 SOLAR_URL = "http://www.hamqsl.com/solarxml.php"
 
+# Leaf elements (<tag>value</tag>, attributes allowed) of the feed, matched in one pass
+_FIELD_RE = re.compile(rb'<(\w+)(?:\s[^>]*)?>([^<]*)</\1>')
+
+# Tags we read - warn if the feed stops sending any of them (changed or
+# malformed feed) instead of just showing '—'
+_EXPECTED_TAGS = ('solarflux', 'aindex', 'kindex', 'xray', 'sunspots', 'aurora')
+
 # Global cache
 _solar_data = {
     'sfi': '—',
@@ -42,18 +53,26 @@ def fetch_solar_data() -> bool:
         response = requests.get(SOLAR_URL, timeout=10)
         response.raise_for_status()
         
-        # Parse XML
-        root = ET.fromstring(response.text)
-        solar = root.find('solardata')
-        
-        if solar is None:
+        # Parse XML - collect leaf values in a single scan (first occurrence wins)
+        content = response.content
+        if b'<solardata>' not in content:
             print("ERROR: Could not find solardata in XML")
             return False
         
+        solar = {}
+        for match in _FIELD_RE.finditer(content):
+            tag = match.group(1).decode('ascii')
+            if tag not in solar:
+                solar[tag] = match.group(2).decode('utf-8', errors='replace')
+        
+        missing = [tag for tag in _EXPECTED_TAGS if tag not in solar]
+        if missing:
+            logger.warning(f"Solar feed is missing expected tags: {', '.join(missing)}")
+        
         # Extract core values (currently displayed)
-        sfi = solar.findtext('solarflux', '—')
-        a_index = solar.findtext('aindex', '—')
-        k_index = solar.findtext('kindex', '—')
+        sfi = solar.get('solarflux', '—')
+        a_index = solar.get('aindex', '—')
+        k_index = solar.get('kindex', '—')
         
         # Convert to numbers if possible
         try:
@@ -78,16 +97,16 @@ def fetch_solar_data() -> bool:
         _solar_data['last_updated'] = datetime.now()
         
         # Store additional fields for future use (not displayed yet)
-        _solar_data['xray'] = solar.findtext('xray')
-        _solar_data['sunspots'] = solar.findtext('sunspots')
-        _solar_data['aurora'] = solar.findtext('aurora')
-        _solar_data['updated_date'] = solar.findtext('updateddate')
-        _solar_data['updated_time'] = solar.findtext('updatedtime')
+        _solar_data['xray'] = solar.get('xray')
+        _solar_data['sunspots'] = solar.get('sunspots')
+        _solar_data['aurora'] = solar.get('aurora')
+        _solar_data['updated_date'] = solar.get('updateddate')
+        _solar_data['updated_time'] = solar.get('updatedtime')
         
         # Band conditions (for future use)
         _solar_data['band_conditions'] = {
-            '80m-40m': solar.findtext('signalnoise'),  # Day/Night
-            'calculated_conditions': solar.findtext('calculatedconditions'),
+            '80m-40m': solar.get('signalnoise'),  # Day/Night
+            'calculated_conditions': solar.get('calculatedconditions'),
         }
         
         print(f"Solar data updated: SFI={sfi}, A={a_index}, K={k_index}")
@@ -96,9 +115,6 @@ def fetch_solar_data() -> bool:
     except requests.RequestException as e:
         print(f"Error fetching solar data: {e}")
         return False
-    except ET.ParseError as e:
-        print(f"Error parsing solar XML: {e}")
-        return False
     except Exception as e:
         print(f"Unexpected error in fetch_solar_data: {e}")
         return False
@@ -1,5 +1,9 @@
 # sun_times.py - Calculate sunrise/sunset times
-from datetime import datetime, timezone
+import bisect
+import functools
+import math
+import time
+from datetime import datetime, timedelta, timezone
 from astral import LocationInfo
 from astral.sun import sun
 from backend.grid_utils import grid_to_latlon
@@ -26,14 +30,18 @@ def get_sun_times(grid_square, date=None):
         print(f"Sunrise: {times['sunrise'].strftime('%H:%M')}")
         print(f"Sunset: {times['sunset'].strftime('%H:%M')}")
     """
-    # Convert grid to lat/lon
-    lat, lon = grid_to_latlon(grid_square)
-    
     # Use today if no date specified
+    now = datetime.now().astimezone()
     if date is None:
-        date = datetime.now()
+        date = now
     
-    # Create location info
+    # Results only change per grid/day/timezone (tz covers DST switches)
+    return dict(_cached_sun_times(grid_square, date.toordinal(), now.tzinfo))
+
+
+@functools.lru_cache(maxsize=512)
+def _observer(lat, lon):
+    """Astral observer for a (rounded) location, shared across calls"""
     location = LocationInfo(
         name="Station",
         region="",
@@ -41,13 +49,20 @@ def get_sun_times(grid_square, date=None):
         latitude=lat,
         longitude=lon
     )
+    return location.observer
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_sun_times(grid_square, date_ordinal, local_tz):
+    """Sun times for grid on a given day (proleptic ordinal), cached"""
+    # Convert grid to lat/lon
+    lat, lon = grid_to_latlon(grid_square)
+    date = datetime.fromordinal(date_ordinal).date()
     
     # Calculate sun times
-    s = sun(location.observer, date=date, tzinfo=timezone.utc)
+    s = sun(_observer(round(lat, 2), round(lon, 2)), date=date, tzinfo=timezone.utc)
     
     # Convert to local timezone
-    local_tz = datetime.now().astimezone().tzinfo
-    
     return {
         'dawn': s['dawn'].astimezone(local_tz),
         'sunrise': s['sunrise'].astimezone(local_tz),
@@ -57,6 +72,97 @@ def get_sun_times(grid_square, date=None):
     }
 
 
+# cos(solar zenith angle) for each event in the batch calculation
+_SUN_EVENT_ZENITHS = (
+    ('dawn', math.cos(math.radians(96.0)), -1),       # civil twilight
+    ('sunrise', math.cos(math.radians(90.833)), -1),  # refraction + solar disc
+    ('sunset', math.cos(math.radians(90.833)), 1),
+    ('dusk', math.cos(math.radians(96.0)), 1),
+)
+
+
+@functools.lru_cache(maxsize=366)
+def _solar_terms(day_of_year):
+    """NOAA approximations at solar noon: (equation of time in minutes, sin/cos of declination)"""
+    g = 2.0 * math.pi / 365.0 * (day_of_year - 1)
+    eqtime = 229.18 * (0.000075 + 0.001868 * math.cos(g) - 0.032077 * math.sin(g)
+                       - 0.014615 * math.cos(2 * g) - 0.040849 * math.sin(2 * g))
+    decl = (0.006918 - 0.399912 * math.cos(g) + 0.070257 * math.sin(g)
+            - 0.006758 * math.cos(2 * g) + 0.000907 * math.sin(2 * g)
+            - 0.002697 * math.cos(3 * g) + 0.00148 * math.sin(3 * g))
+    return eqtime, math.sin(decl), math.cos(decl)
+
+
+@functools.lru_cache(maxsize=2048)
+def _sun_event_minutes(grid_square, date_ordinal):
+    """
+    Sun events for grid on a day (proleptic ordinal), as UTC minutes after midnight
+    Returns tuple of (name, minutes or None) - cached so repeated small
+    batches (e.g. per UI refresh) only pay for grids they have not seen.
+    """
+    lat, lon = grid_to_latlon(grid_square)
+    day_of_year = datetime.fromordinal(date_ordinal).timetuple().tm_yday
+    eqtime, sin_decl, cos_decl = _solar_terms(day_of_year)
+    
+    lat_rad = math.radians(lat)
+    sin_lat = math.sin(lat_rad)
+    cos_lat_decl = math.cos(lat_rad) * cos_decl
+    noon = 720.0 - 4.0 * lon - eqtime
+    
+    events = [('noon', noon)]
+    for name, cos_zenith, sign in _SUN_EVENT_ZENITHS:
+        cos_ha = (cos_zenith - sin_lat * sin_decl) / cos_lat_decl
+        if -1.0 <= cos_ha <= 1.0:
+            events.append((name, noon + sign * 4.0 * math.degrees(math.acos(cos_ha))))
+        else:
+            events.append((name, None))
+    
+    return tuple(events)
+
+
+def get_sun_times_batch(grid_squares, date=None):
+    """
+    Calculate sun times for many grid squares at once.
+    
+    Uses the closed-form NOAA sunrise/sunset equations. The date-dependent
+    terms (equation of time, declination) are computed once per day and
+    each grid's events once per day, so repeated batches are mostly cache
+    hits. Accuracy is about a minute, which is fine for display - use
+    get_sun_times() for astral's full solution.
+    
+    Args:
+        grid_squares: iterable of Maidenhead grids
+        date: datetime/date object (default: today in local timezone)
+    
+    Returns:
+        dict: {grid: {'dawn', 'sunrise', 'noon', 'sunset', 'dusk'}} with local
+        datetime values (None where the event does not occur, e.g. polar day/night).
+        Invalid grids are skipped.
+    """
+    now = datetime.now().astimezone()
+    if date is None:
+        date = now
+    local_tz = now.tzinfo
+    
+    date_ordinal = date.toordinal()
+    midnight_utc = datetime(date.year, date.month, date.day, tzinfo=timezone.utc)
+    
+    results = {}
+    for grid in set(grid_squares):
+        try:
+            events = _sun_event_minutes(grid, date_ordinal)
+        except (ValueError, AttributeError):
+            continue
+        
+        results[grid] = {
+            name: (midnight_utc + timedelta(minutes=minutes)).astimezone(local_tz)
+            if minutes is not None else None
+            for name, minutes in events
+        }
+    
+    return results
+
+
 def format_sun_times(grid_square, time_format="%H:%M"):
     """
     Get formatted sunrise/sunset times as strings.
@@ -102,18 +208,33 @@ def get_daylight_status(grid_square):
     Returns:
         str: "day", "night", "dawn", "dusk", or "error"
     """
+    # Status is shared by all lookups for the same grid within a minute
+    return _daylight_status(grid_square, int(time.time()) // 60)
+
+
+# Label for each interval between [dawn, sunrise, sunset, dusk]
+_DAYLIGHT_LABELS = ("night", "dawn", "day", "dusk", "night")
+
+
+@functools.lru_cache(maxsize=4096)
+def _daylight_status(grid_square, minute_key):
+    """Daylight status for grid, cached per minute bucket"""
     try:
         times = get_sun_times(grid_square)
         now = datetime.now().astimezone()
         
-        if times['dawn'] <= now < times['sunrise']:
-            return "dawn"
-        elif times['sunrise'] <= now < times['sunset']:
-            return "day"
-        elif times['sunset'] <= now < times['dusk']:
-            return "dusk"
-        else:
-            return "night"
+        # Events are for one UTC date, so for western grids sunset/dusk can
+        # land before dawn; roll wrapped edges (and now) forward a day
+        edges = [times['dawn']]
+        for name in ('sunrise', 'sunset', 'dusk'):
+            edge = times[name]
+            if edge < edges[-1]:
+                edge += timedelta(days=1)
+            edges.append(edge)
+        if now < edges[0]:
+            now += timedelta(days=1)
+        
+        return _DAYLIGHT_LABELS[bisect.bisect_right(edges, now)]
     except Exception:
         return "error"
 
@@ -3,6 +3,7 @@
 Provides voice alerts using pyttsx3 for spotted callsigns
 """
 
+import functools
 import threading
 import queue
 from backend.app_logging import get_logger
@@ -10,11 +11,26 @@ from backend.app_logging import get_logger
 logger = get_logger(__name__)
 
 # Global TTS engine and queue
+# Queue is bounded - during a burst the oldest alerts are dropped and the
+# worker speaks whatever is waiting as one utterance.
+_MAX_QUEUED_ALERTS = 16
+_MAX_ALERTS_PER_UTTERANCE = 4
 _tts_engine = None
-_alert_queue = queue.Queue()
+_alert_queue = queue.Queue(maxsize=_MAX_QUEUED_ALERTS)
 _worker_thread = None
 _running = False
 
+# Spoken form of digits, indexed by int value
+_DIGIT_WORDS = ('zero', 'one', 'two', 'three', 'four',
+                'five', 'six', 'seven', 'eight', 'nine')
+
+# Spoken form of band numbers (e.g., "20" -> "twenty")
+_BAND_WORDS = {
+    '6': 'six', '10': 'ten', '12': 'twelve', '15': 'fifteen',
+    '17': 'seventeen', '20': 'twenty', '30': 'thirty', '40': 'forty',
+    '60': 'sixty', '80': 'eighty', '160': 'one sixty',
+}
+
 
 def _init_engine():
     """Initialize the TTS engine (lazy loading)"""
@@ -54,21 +70,33 @@ def _alert_worker():
     
     logger.info("Voice alert worker started")
     
-    while _running:
+    stop = False
+    while _running and not stop:
         try:
-            # Wait for an alert (blocking with timeout)
-            message = _alert_queue.get(timeout=1.0)
+            # Wait for an alert
+            message = _alert_queue.get()
             
             if message is None:  # Shutdown signal
                 break
             
-            # Speak the message
-            logger.info(f"VOICE ALERT - Speaking: {message}")
-            engine.say(message)
+            # Coalesce anything else already waiting into the same utterance
+            messages = [message]
+            while len(messages) < _MAX_ALERTS_PER_UTTERANCE:
+                try:
+                    message = _alert_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if message is None:
+                    stop = True
+                    break
+                messages.append(message)
+            
+            # Speak the message(s)
+            text = "; ".join(messages)
+            logger.info(f"VOICE ALERT - Speaking: {text}")
+            engine.say(text)
             engine.runAndWait()
             
-        except queue.Empty:
-            continue
         except Exception as e:
             logger.error(f"Voice alert error: {e}")
     
@@ -96,7 +124,7 @@ def stop_voice_alerts():
         return
     
     _running = False
-    _alert_queue.put(None)  # Shutdown signal
+    _enqueue(None)  # Shutdown signal
     logger.info("Voice alerts disabled")
 
 
@@ -120,9 +148,24 @@ def speak_callsign(callsign, band=None):
         message = _format_callsign(callsign)
     
     # Queue the alert
-    _alert_queue.put(message)
+    _enqueue(message)
+
+
+def _enqueue(message):
+    """Queue an alert without blocking - drops the oldest alert if full"""
+    while True:
+        try:
+            _alert_queue.put_nowait(message)
+            return
+        except queue.Full:
+            try:
+                dropped = _alert_queue.get_nowait()
+                logger.info(f"VOICE ALERT - Queue full, dropped: {dropped}")
+            except queue.Empty:
+                pass
 
 
+@functools.lru_cache(maxsize=4096)
 def _format_callsign(callsign):
     """
     Format callsign for better speech
@@ -134,12 +177,9 @@ def _format_callsign(callsign):
     """
     result = []
     for char in callsign.upper():
-        if char.isdigit():
+        if '0' <= char <= '9':
             # Speak numbers as words
-            numbers = {'0': 'zero', '1': 'one', '2': 'two', '3': 'three', 
-                      '4': 'four', '5': 'five', '6': 'six', '7': 'seven',
-                      '8': 'eight', '9': 'nine'}
-            result.append(numbers.get(char, char))
+            result.append(_DIGIT_WORDS[ord(char) - 48])
         elif char.isalpha():
             # Speak letters individually
             result.append(char)
@@ -149,6 +189,7 @@ def _format_callsign(callsign):
     return ' '.join(result)
 
 
+@functools.lru_cache(maxsize=64)
 def _format_band(band):
     """
     Format band for speech
@@ -163,30 +204,7 @@ def _format_band(band):
     if band.endswith('M'):
         # Meters
         num = band[:-1]
-        if num == '6':
-            return "six meters"
-        elif num == '10':
-            return "ten meters"
-        elif num == '12':
-            return "twelve meters"
-        elif num == '15':
-            return "fifteen meters"
-        elif num == '17':
-            return "seventeen meters"
-        elif num == '20':
-            return "twenty meters"
-        elif num == '30':
-            return "thirty meters"
-        elif num == '40':
-            return "forty meters"
-        elif num == '60':
-            return "sixty meters"
-        elif num == '80':
-            return "eighty meters"
-        elif num == '160':
-            return "one sixty meters"
-        else:
-            return f"{num} meters"
+        return f"{_BAND_WORDS.get(num, num)} meters"
     elif band.endswith('CM'):
         # Centimeters
         num = band[:-2]
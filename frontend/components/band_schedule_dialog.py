@@ -5,21 +5,83 @@ from backend.app_logging import get_logger
 
 logger = get_logger(__name__)
 
+import functools
+import queue
+import re
+import threading
+
 import flet as ft
 from backend.message_bus import publish
 
+# Bands shown in the dialog, in display order
+_BANDS = ("160m", "80m", "60m", "40m", "30m", "20m", "17m", "15m", "12m", "10m", "6m")
+
+# Cluster filter band number ("160m" -> "160") and per-band clear command
+_BAND_NUM = {band: band[:-1] for band in _BANDS}
+_CLEAR_CMDS = {band: f"set/filter/{_BAND_NUM[band]} nobandtime" for band in _BANDS}
+
+# HHMM, 0000-2359
+_TIME_RE = re.compile(r'([01][0-9]|2[0-3])[0-5][0-9]')
+
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_time(time_str):
+    """Validate HHMM format (also accepts HH:MM) - cached, inputs repeat a lot"""
+    if not time_str:
+        return False
+    
+    # Remove colon if present, then 4 digits: 00-23 hour, 00-59 minute
+    return _TIME_RE.fullmatch(time_str.replace(':', '')) is not None
+
+
+# Config writes happen on a background thread; only the latest pending
+# write is performed (last write wins)
+_config_write_queue = queue.Queue()
+_config_write_thread = None
+
+
+def _config_write_worker():
+    """Drain queued config writes, skipping stale intermediates"""
+    while True:
+        write = _config_write_queue.get()
+        while True:
+            try:
+                write = _config_write_queue.get_nowait()
+            except queue.Empty:
+                break
+        
+        try:
+            write()
+        except Exception as e:
+            logger.error(f"BAND SCHEDULE ✗ Failed to save config: {e}")
+
+
+def _queue_config_write(write):
+    """Queue a config write (callable) without blocking the UI thread"""
+    global _config_write_thread
+    
+    if _config_write_thread is None:
+        _config_write_thread = threading.Thread(target=_config_write_worker, daemon=True)
+        _config_write_thread.start()
+    
+    _config_write_queue.put_nowait(write)
+
 
 class BandScheduleDialog:
     """Dialog for setting band-specific time filters"""
     
     def __init__(self, page):
         self.page = page
+        self._config = None
+        self._config_mtime = None
         
-        # Load saved schedules from config
-        self.schedules = self._load_schedules()
-        
+        # Schedules and controls are loaded/built on first show()
+        self._built = False
+        self.schedules = {}
+        self._last_saved = {}
+        self._applied = {}  # Last schedules sent to the cluster (what's actually active)
         self.band_rows = {}
-        self.dialog = self._build_dialog()
+        self.dialog = None
     
     def _load_schedules(self):
         """Load band schedules from config"""
@@ -28,6 +90,10 @@ class BandScheduleDialog:
         config = load_config()
         schedules = {}
         
+        # Keep the parsed config for saving (re-read only if the file changes)
+        self._config = config
+        self._config_mtime = self._get_config_mtime()
+        
         # Default values for low bands
         defaults = {
             "160m": ("2200", "1300", False),
@@ -43,7 +109,7 @@ class BandScheduleDialog:
             "6m": ("", "", False),
         }
         
-        for band in ["160m", "80m", "60m", "40m", "30m", "20m", "17m", "15m", "12m", "10m", "6m"]:
+        for band in _BANDS:
             start = config.get('band_schedule', f'{band}_start', fallback=defaults[band][0])
             stop = config.get('band_schedule', f'{band}_stop', fallback=defaults[band][1])
             enabled = config.getboolean('band_schedule', f'{band}_enabled', fallback=defaults[band][2])
@@ -51,20 +117,45 @@ class BandScheduleDialog:
         
         return schedules
     
+    def _get_config_mtime(self):
+        """Modification time of config.ini (None if missing)"""
+        from backend.config import get_config_path
+        
+        try:
+            return get_config_path().stat().st_mtime_ns
+        except OSError:
+            return None
+    
     def _save_schedules(self):
-        """Save band schedules to config"""
+        """Save band schedules to config (in the background)"""
+        if self.schedules == self._last_saved:
+            logger.info("BAND SCHEDULE → No changes, skipping save")
+            return
+        
+        # _last_saved is updated by _write_schedules once the write succeeds
+        schedules = dict(self.schedules)
+        _queue_config_write(lambda: self._write_schedules(schedules))
+    
+    def _write_schedules(self, schedules):
+        """Write band schedules to config.ini"""
         from backend.config import load_config, save_config
         
-        config = load_config()
-        if 'band_schedule' not in config:
-            config['band_schedule'] = {}
+        # Reuse cached config unless something else wrote config.ini since
+        config = self._config
+        if config is None or self._get_config_mtime() != self._config_mtime:
+            config = load_config()
         
-        for band, (start, stop, enabled) in self.schedules.items():
-            config['band_schedule'][f'{band}_start'] = start
-            config['band_schedule'][f'{band}_stop'] = stop
-            config['band_schedule'][f'{band}_enabled'] = str(enabled)
+        section = {}
+        for band, (start, stop, enabled) in schedules.items():
+            section[f'{band}_start'] = start
+            section[f'{band}_stop'] = stop
+            section[f'{band}_enabled'] = str(enabled)
+        config.read_dict({'band_schedule': section})
         
         save_config(config)
+        self._last_saved = schedules
+        self._config = config
+        self._config_mtime = self._get_config_mtime()
         logger.info("BAND SCHEDULE → Saved to config.ini")
     
     def _build_dialog(self):
@@ -72,17 +163,18 @@ class BandScheduleDialog:
         
         # Create rows for each band
         rows = []
-        for band in ["160m", "80m", "60m", "40m", "30m", "20m", "17m", "15m", "12m", "10m", "6m"]:
+        for band in _BANDS:
             start_time, stop_time, enabled = self.schedules[band]
             
-            enabled_cb = ft.Checkbox(value=enabled, on_change=lambda e, b=band: self._toggle_band(b, e))
+            enabled_cb = ft.Checkbox(value=enabled, data=band, on_change=self._toggle_band)
             
             start_field = ft.TextField(
                 value=start_time,
                 hint_text="HHMM",
                 width=80,
                 text_size=14,
-                on_change=lambda e, b=band: self._update_start(b, e),
+                data=band,
+                on_change=self._update_start,
             )
             
             stop_field = ft.TextField(
@@ -90,7 +182,8 @@ class BandScheduleDialog:
                 hint_text="HHMM",
                 width=80,
                 text_size=14,
-                on_change=lambda e, b=band: self._update_stop(b, e),
+                data=band,
+                on_change=self._update_stop,
             )
             
             self.band_rows[band] = {
@@ -130,79 +223,78 @@ class BandScheduleDialog:
             modal=True,
         )
     
-    def _toggle_band(self, band, e):
-        """Toggle band schedule on/off"""
+    def _toggle_band(self, e):
+        """Toggle band schedule on/off (band is in control.data)"""
+        band = e.control.data
         start, stop, _ = self.schedules[band]
         self.schedules[band] = (start, stop, e.control.value)
     
-    def _update_start(self, band, e):
+    def _update_start(self, e):
         """Update start time"""
+        band = e.control.data
         _, stop, enabled = self.schedules[band]
         self.schedules[band] = (e.control.value, stop, enabled)
     
-    def _update_stop(self, band, e):
+    def _update_stop(self, e):
         """Update stop time"""
+        band = e.control.data
         start, _, enabled = self.schedules[band]
         self.schedules[band] = (start, e.control.value, enabled)
     
     def _validate_time(self, time_str):
         """Validate HHMM format (also accepts HH:MM)"""
-        if not time_str:
-            return False
-        
-        # Remove colon if present
-        time_str = time_str.replace(':', '')
-        
-        # Should be 4 digits
-        if len(time_str) != 4:
-            return False
-        
-        try:
-            hour = int(time_str[:2])
-            minute = int(time_str[2:])
-            return 0 <= hour <= 23 and 0 <= minute <= 59
-        except:
-            return False
+        return _is_valid_time(time_str)
     
     def _apply_filters(self, e):
         """Send filter commands to cluster"""
         logger.info("BAND SCHEDULE → Applying time filters")
         
+        # Validate every enabled band before building any commands
+        active = {
+            band: (start, stop)
+            for band, (start, stop, enabled) in self.schedules.items()
+            if enabled and start and stop
+        }
+        invalid = [
+            band for band, (start, stop) in active.items()
+            if not self._validate_time(start) or not self._validate_time(stop)
+        ]
+        if invalid:
+            band = invalid[0]
+            start, stop = active[band]
+            self._show_error(f"Invalid time format for {band}. Use HHMM (e.g., 2200)")
+            logger.error(f"BAND SCHEDULE ✗ Invalid time format: {band} {start}-{stop}")
+            return
+        
         commands = []
         enabled_count = 0
         
-        for band, (start, stop, enabled) in self.schedules.items():
-            band_num = band.replace('m', '')  # "160m" -> "160"
-            
-            if enabled and start and stop:
-                # Validate times
-                if not self._validate_time(start) or not self._validate_time(stop):
-                    self._show_error(f"Invalid time format for {band}. Use HHMM (e.g., 2200)")
-                    logger.error(f"BAND SCHEDULE ✗ Invalid time format: {band} {start}-{stop}")
-                    return
+        for band in self.schedules:
+            if band in active:
+                start, stop = active[band]
                 
                 # Remove colons for cluster command (HH:MM -> HHMM)
                 start_clean = start.replace(':', '')
                 stop_clean = stop.replace(':', '')
                 
                 # Send filter command
-                cmd = f"set/filter/{band_num} bandtime/pass {start_clean},{stop_clean}"
+                cmd = f"set/filter/{_BAND_NUM[band]} bandtime/pass {start_clean},{stop_clean}"
                 commands.append(cmd)
                 enabled_count += 1
                 logger.info(f"  {band}: ENABLED {start_clean}-{stop_clean} → {cmd}")
             else:
                 # Clear filter for this band
-                cmd = f"set/filter/{band_num} nobandtime"
+                cmd = _CLEAR_CMDS[band]
                 commands.append(cmd)
                 logger.info(f"  {band}: DISABLED → {cmd}")
         
         logger.info(f"BAND SCHEDULE → Sending {len(commands)} commands ({enabled_count} enabled)")
         
-        # Send all commands
-        for cmd in commands:
-            publish({"type": "cluster_command", "data": cmd})
+        # Send all commands in one bus message
+        publish({"type": "cluster_command_batch", "data": commands})
         
         # Save to config
+        self._applied = dict(self.schedules)
         self._save_schedules()
         
         logger.info(f"BAND SCHEDULE ✓ Applied {enabled_count} enabled filters")
@@ -214,11 +306,13 @@ class BandScheduleDialog:
         """Clear all time filters"""
         logger.info("BAND SCHEDULE → Clearing all filters")
         
+        commands = []
         for band in self.schedules:
-            band_num = band.replace('m', '')
-            cmd = f"set/filter/{band_num} nobandtime"
+            cmd = _CLEAR_CMDS[band]
             logger.info(f"  {band}: CLEARING → {cmd}")
-            publish({"type": "cluster_command", "data": cmd})
+            commands.append(cmd)
+        
+        publish({"type": "cluster_command_batch", "data": commands})
         
         # Reset UI and schedules
         for band in self.schedules:
@@ -228,21 +322,18 @@ class BandScheduleDialog:
             self.band_rows[band]["enabled"].value = False
         
         # Save cleared state
+        self._applied = dict(self.schedules)
         self._save_schedules()
         
-        try:
-            for band in self.band_rows:
-                self.band_rows[band]["start"].update()
-                self.band_rows[band]["stop"].update()
-                self.band_rows[band]["enabled"].update()
-        except:
-            pass
-        
         logger.info("BAND SCHEDULE ✓ Cleared all filters")
+        
+        # Single page update pushes the reset fields along with the snackbar
         self._show_success("Cleared all band time filters")
     
     def _close(self, e):
         """Close dialog"""
+        if self.dialog is None:
+            return
         self.dialog.open = False
         try:
             self.page.update()
@@ -267,8 +358,29 @@ class BandScheduleDialog:
         self.page.snack_bar.open = True
         self.page.update()
     
+    def _reset_to_applied(self):
+        """Put the last applied schedules back into self.schedules and the fields"""
+        self.schedules = dict(self._applied)
+        for band, (start, stop, enabled) in self.schedules.items():
+            row = self.band_rows[band]
+            row["start"].value = start
+            row["stop"].value = stop
+            row["enabled"].value = enabled
+    
     def show(self):
         """Show the dialog"""
-        self.page.overlay.append(self.dialog)
+        if not self._built:
+            # Load saved schedules from config
+            self.schedules = self._load_schedules()
+            self._last_saved = dict(self.schedules)
+            self._applied = dict(self.schedules)
+            self.dialog = self._build_dialog()
+            self._built = True
+        else:
+            # Edits from a previous open that were closed without Apply don't stick
+            self._reset_to_applied()
+        
+        if self.dialog not in self.page.overlay:
+            self.page.overlay.append(self.dialog)
         self.dialog.open = True
         self.page.update()
\ No newline at end of file
@@ -4,9 +4,15 @@ from backend.dxcc_challenge import get_stats
 from backend.dxcc_lookup import get_country_from_prefix
 from backend.dxcc_prefixes import get_prefix
 from backend.file_paths import get_config_file
-import json
+import functools
+import threading
 from pathlib import Path
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional - stdlib json fallback
+    from json import loads as _json_loads
+
 from backend.file_paths import (
     get_challenge_data_file,
     get_dxcc_entities_file,
@@ -14,77 +20,267 @@ from backend.file_paths import (
     get_dxcc_mapping_file
 )
 
+# Challenge bands, lowest to highest. Worked bands per entity are kept as
+# a bitmask with bit BAND_INDEX[band] set.
+BANDS = ("160M", "80M", "60M", "40M", "30M", "20M", "17M", "15M", "12M", "10M", "6M")
+BAND_INDEX = {band: i for i, band in enumerate(BANDS)}
+
+# DXCC number -> prefix never changes while running; remember each answer
+# so refreshes that fall back to dxcc_mapping.json skip the lookups
+_get_prefix = functools.lru_cache(maxsize=512)(get_prefix)
+
+# Styles used by the table/summary builders, looked up once
+_BOLD = ft.FontWeight.BOLD
+_GREEN = ft.Colors.GREEN
+_TABLE_BORDER = ft.border.all(1, ft.Colors.GREY_700)
+_HEAD_COLOR = ft.Colors.BLUE_GREY_800
+
+# Text settings for a worked band cell
+CHECK_KW = dict(value="✓", color=_GREEN, weight=_BOLD)
+
+# Only ~20 rows fit on screen, so the table starts with the first
+# ROW_BATCH rows and adds another batch each time it's scrolled near the end
+ROW_BATCH = 60
+SCROLL_LOAD_MARGIN = 400  # pixels from the bottom
+
+
+def _check_cell():
+    """Band cell for a worked band"""
+    return ft.DataCell(ft.Text(**CHECK_KW))
+
+
+def _empty_cell():
+    """Band cell for a band not worked yet"""
+    # Flet needs a separate control for every cell, so these can't be
+    # shared - but with no text or style set there is nothing to send
+    return ft.DataCell(ft.Text())
+
+
+# The DXCC reference files only change when the user re-downloads them, so
+# parse them once and share the result. ChallengeTable.refresh() clears these.
+@functools.lru_cache(maxsize=1)
+def _load_dxcc_mapping():
+    """Load DXCC number -> country name mapping"""
+    mapping_file = get_dxcc_mapping_file()
+    if mapping_file.exists():
+        try:
+            return _json_loads(mapping_file.read_bytes())
+        except:
+            pass
+    return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_name_overrides():
+    """Load DXCC name overrides (ARRL preferred names)"""
+    override_file = get_dxcc_overrides_file()
+    if override_file.exists():
+        try:
+            return _json_loads(override_file.read_bytes())
+        except Exception as e:
+            print(f"Error loading name overrides: {e}")
+    return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_all_dxcc_entities():
+    """Load all 340 current DXCC entities from dxcc_entities.json"""
+    entities_file = get_dxcc_entities_file()
+    if entities_file.exists():
+        try:
+            data = _json_loads(entities_file.read_bytes())
+            
+            # Load name overrides
+            overrides = _load_name_overrides()
+            
+            # Filter to only current (not deleted) entities
+            current = {}
+            for dxcc_num, entity_data in data.items():
+                if entity_data.get("current", False):
+                    # Apply name override if exists (data is a fresh parse, safe to modify)
+                    if dxcc_num in overrides:
+                        entity_data["name"] = overrides[dxcc_num]
+                    current[dxcc_num] = entity_data
+            
+            return current
+        except Exception as e:
+            print(f"Error loading dxcc_entities.json: {e}")
+    
+    # Fallback to old method if file doesn't exist
+    return _load_dxcc_mapping_fallback()
+
+
+def _load_dxcc_mapping_fallback():
+    """Fallback to old dxcc_mapping.json format"""
+    mapping = _load_dxcc_mapping()
+    try:
+        # Convert to entity format
+        entities = {}
+        for dxcc_num, name in mapping.items():
+            entities[dxcc_num] = {
+                "name": name,
+                "prefix": _get_prefix(int(dxcc_num)),
+                "current": True
+            }
+        return entities
+    except:
+        pass
+    return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_challenge_data(challenge_file, mtime_ns, size):
+    """Parse challenge_data.json into per-entity band bitmasks and per-band counts"""
+    # Cached on the file's mtime/size - loading the same file again (Settings
+    # reloads right before calling refresh()) reuses the last result
+    try:
+        data = _json_loads(challenge_file.read_bytes())
+        
+        # One pass over the pairs: bitmask of worked bands per entity,
+        # plus how many entities are worked on each band
+        entities = {}
+        band_counts = [0] * len(BANDS)  # entities worked, indexed like BANDS
+        for band_entity_pair in data.get("raw_band_entity_pairs", []):
+            if len(band_entity_pair) != 2:
+                continue
+            band, entity = band_entity_pair
+            
+            bit = BAND_INDEX.get(band)
+            if bit is None:
+                continue  # Not a challenge band
+            mask = 1 << bit
+            worked = entities.get(entity, 0)
+            if not worked & mask:  # Count each entity once per band
+                entities[entity] = worked | mask
+                band_counts[bit] += 1
+        
+        return {
+            "total_entities": data.get("total_entities", 0),
+            "total_slots": data.get("total_challenge_slots", 0),
+            "band_counts": band_counts,
+            "entities": entities,  # entity -> bitmask of bands
+            "slots_60m": band_counts[BAND_INDEX["60M"]],
+        }
+    except Exception as e:
+        print(f"Error loading challenge data: {e}")
+        return None
+
+
+def _file_stamp(path):
+    """(mtime, size) of a file, or None if it doesn't exist"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _clear_dxcc_caches():
+    """Forget the cached DXCC reference data so the next load re-reads the files"""
+    _load_dxcc_mapping.cache_clear()
+    _load_name_overrides.cache_clear()
+    _load_all_dxcc_entities.cache_clear()
+
+
 class ChallengeTable(ft.Column):
     """Display DXCC Challenge progress in a scrollable table with filters and sorting"""
     
     def __init__(self):
         super().__init__()
         
-        # Load challenge data
-        self.challenge_data = self._load_challenge_data()
+        # Challenge data is loaded in the background (see _initial_load)
+        self._files_stamp = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self.challenge_data = None
+        self._table = None
         
         # Sort state: 'country' or 'prefix'
         self.sort_by = 'prefix'  # Default to prefix sort
         self.sort_reverse = False  # False = ascending, True = descending
         
         # Filter state
-        self.selected_bands = {
-            "160M": True,
-            "80M": True,
-            "60M": True,
-            "40M": True,
-            "30M": True,
-            "20M": True,
-            "17M": True,
-            "15M": True,
-            "12M": True,
-            "10M": True,
-            "6M": True,
-        }
+        self.selected_bands = {band: True for band in BANDS}
         self.show_needed_only = False
         
-        # Build UI
+        # Data the pooled table cells were built from (see _build_table)
+        self._pool_source = (None, None)
+        
+        # Placeholder until the JSON files are read - that happens off the
+        # UI thread so the app window isn't held up at startup
         self.controls = [
-            self._build_summary(),
-            ft.Divider(height=10),
-            self._build_filters(),
-            ft.Divider(height=10),
-            self._build_table(),
+            ft.Row([
+                ft.ProgressRing(width=20, height=20),
+                ft.Text("Loading challenge data...", size=14),
+            ], spacing=10),
         ]
         
         self.scroll = ft.ScrollMode.AUTO
         self.expand = True
+        # Whichever of us or the table's ListView ends up scrolling,
+        # keep loading rows as the user gets near the bottom
+        self.on_scroll = self._on_table_scroll
+        
+        threading.Thread(target=self._initial_load, daemon=True).start()
+    
+    def _initial_load(self):
+        """Load the data files and build the UI (runs in a background thread)"""
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"Error loading challenge table: {e}")
+    
+    def did_mount(self):
+        super().did_mount()
+        # The background load may have finished before we were on the page,
+        # in which case its update() went nowhere
+        if self._loaded:
+            try:
+                self.update()
+            except:
+                pass
+    
+    def _data_files_stamp(self):
+        """Stamps of every file the table is built from, to spot changes"""
+        return tuple(_file_stamp(path) for path in (
+            get_challenge_data_file(),
+            get_dxcc_entities_file(),
+            get_dxcc_overrides_file(),
+            get_dxcc_mapping_file(),
+        ))
+    
+    def _load_reference_data(self):
+        """Grab the (cached) DXCC entity list, name overrides and mapping"""
+        self._mapping = _load_dxcc_mapping()
+        self._overrides = _load_name_overrides()
+        self._entities = _load_all_dxcc_entities()
+        
+        # Flatten the entity dicts into parallel lists - the table build
+        # loop then just indexes by position instead of digging into dicts
+        self._names = [e["name"] for e in self._entities.values()]
+        self._prefixes = [e["prefix"] for e in self._entities.values()]
+        self._entity_nums = [int(n) for n in self._entities]
+        
+        # Names as shown in the table - truncate long ones once here
+        self._display_names = [n if len(n) <= 25 else n[:22] + "..." for n in self._names]
+        
+        # Only two sort keys exist, so sort once here (as lists of
+        # positions). Descending is just the same list walked backwards.
+        positions = range(len(self._names))
+        self._orderings = {
+            'country': sorted(positions, key=self._names.__getitem__),
+            'prefix': sorted(positions, key=self._prefixes.__getitem__),
+        }
     
     def _load_challenge_data(self):
         """Load challenge data from JSON"""
         challenge_file = get_challenge_data_file()
-        if not challenge_file.exists():
-            return None
-        
         try:
-            data = json.loads(challenge_file.read_text())
-            
-            # Organize by entity
-            entities = {}
-            for band_entity_pair in data.get("raw_band_entity_pairs", []):
-                if len(band_entity_pair) != 2:
-                    continue
-                band, entity = band_entity_pair
-                
-                if entity not in entities:
-                    entities[entity] = set()
-                entities[entity].add(band)
-            
-            return {
-                "total_entities": data.get("total_entities", 0),
-                "total_slots": data.get("total_challenge_slots", 0),
-                "entities_by_band": data.get("entities_by_band", {}),
-                "entities": entities,  # entity -> set of bands
-                "raw_band_entity_pairs": data.get("raw_band_entity_pairs", []),
-            }
-        except Exception as e:
-            print(f"Error loading challenge data: {e}")
-            return None
+            st = challenge_file.stat()
+        except OSError:
+            return None  # No challenge data downloaded yet
+        
+        return _parse_challenge_data(challenge_file, st.st_mtime_ns, st.st_size)
     
     def _build_summary(self):
         """Build summary statistics"""
@@ -92,8 +288,7 @@ class ChallengeTable(ft.Column):
             return ft.Text("No challenge data loaded. Download from Settings tab.", size=16, color=ft.Colors.ORANGE_400)
     
         # Use 340 for max (all current DXCC entities), not just worked count
-        all_entities = self._load_all_dxcc_entities()
-        total_entities = len(all_entities)  # Should be 340
+        total_entities = len(self._entities)  # Should be 340
     
         # Safety check - prevent divide by zero
         if total_entities == 0:
@@ -116,7 +311,7 @@ class ChallengeTable(ft.Column):
             )
     
         # Calculate 60m slots (to exclude from main count)
-        slots_60m = sum(1 for band, dxcc in self.challenge_data.get("raw_band_entity_pairs", []) if band == "60M")
+        slots_60m = self.challenge_data.get("slots_60m", 0)
         slots_no_60m = total_slots - slots_60m  # Subtract 60m, not 6m!
     
         max_slots_no_60m = total_entities * 10  # 10 bands (excludes 60m)
@@ -124,22 +319,23 @@ class ChallengeTable(ft.Column):
         # Total slots
         max_slots_total = total_entities * 11  # 11 bands (160m-6m including 60m)
     
+        # Percent scale factors - total_entities is non-zero (checked above)
+        inv_total = 100.0 / total_entities
+        inv_max_slots = 100.0 / max_slots_total
+    
         # Band statistics
-        bands_stats = []
-        for band in ["160M", "80M", "60M", "40M", "30M", "20M", "17M", "15M", "12M", "10M", "6M"]:
-            count = self.challenge_data["entities_by_band"].get(band, 0)
-            # Safety check for division
-            pct = (count / total_entities * 100) if total_entities > 0 else 0
-            bands_stats.append(f"{band}: {count}/{total_entities} ({pct:.0f}%)")
+        bands_stats = [
+            f"{band}: {count}/{total_entities} ({count * inv_total:.0f}%)"
+            for band, count in zip(BANDS, self.challenge_data["band_counts"])
+        ]
     
         return ft.Container(
             content=ft.Column([
-                ft.Text("DXCC Challenge Progress", size=24, weight=ft.FontWeight.BOLD),
+                ft.Text("DXCC Challenge Progress", size=24, weight=_BOLD),
 
                 ft.Row([
-                    ft.Text(f"Total Entities: {worked_entities}/{total_entities}", size=18, weight=ft.FontWeight.BOLD),
-                    ft.Text(f"({worked_entities/total_entities*100:.1f}%)" if total_entities > 0 else "(0.0%)", 
-                        size=18, color=ft.Colors.GREEN),
+                    ft.Text(f"Total Entities: {worked_entities}/{total_entities}", size=18, weight=_BOLD),
+                    ft.Text(f"({worked_entities * inv_total:.1f}%)", size=18, color=_GREEN),
                 ], spacing=10),
                 ft.Container(height=5),
             
@@ -155,12 +351,11 @@ class ChallengeTable(ft.Column):
                 # Total slots
                 ft.Row([
                     ft.Text(f"Total Slots: {total_slots}/{max_slots_total}", size=16),
-                    ft.Text(f"({total_slots/max_slots_total*100:.1f}% complete)" if max_slots_total > 0 else "(0.0%)", 
-                            size=16, color=ft.Colors.GREEN),
+                    ft.Text(f"({total_slots * inv_max_slots:.1f}% complete)", size=16, color=_GREEN),
                 ], spacing=10),
             
                 ft.Container(height=10),
-                ft.Text("Band Progress:", size=14, weight=ft.FontWeight.BOLD),
+                ft.Text("Band Progress:", size=14, weight=_BOLD),
                 ft.Row([
                     ft.Column([ft.Text(s, size=12) for s in bands_stats[:6]]),
                     ft.Column([ft.Text(s, size=12) for s in bands_stats[6:]]),
@@ -195,14 +390,14 @@ class ChallengeTable(ft.Column):
         )
         
         # Band checkboxes - create all in one row
-        band_row_controls = []
-        for band in ["160M", "80M", "60M", "40M", "30M", "20M", "17M", "15M", "12M", "10M", "6M"]:
-            check = ft.Checkbox(
+        # (kept so All/None can just flip their values)
+        self._band_checkboxes = {}
+        for band in BANDS:
+            self._band_checkboxes[band] = ft.Checkbox(
                 label=band,
                 value=self.selected_bands[band],
                 on_change=lambda e, b=band: self._band_filter_changed(b, e.control.value),
             )
-            band_row_controls.append(check)
         
         return ft.Container(
             content=ft.Column([
@@ -217,10 +412,10 @@ class ChallengeTable(ft.Column):
                 ft.Container(height=5),
                 
                 # Line 2: All band checkboxes in one row
-                ft.Row(band_row_controls, spacing=8),
+                ft.Row(list(self._band_checkboxes.values()), spacing=8),
             ], spacing=0),
             padding=10,
-            bgcolor=ft.Colors.BLUE_GREY_800,
+            bgcolor=_HEAD_COLOR,
             border_radius=10,
         )
     
@@ -231,37 +426,28 @@ class ChallengeTable(ft.Column):
     
     def _select_all_bands(self, e):
         """Select all bands"""
-        for band in self.selected_bands:
-            self.selected_bands[band] = True
-        self._rebuild_filters_and_table()
+        self._set_all_bands(True)
     
     def _select_no_bands(self, e):
         """Deselect all bands"""
-        for band in self.selected_bands:
-            self.selected_bands[band] = False
-        self._rebuild_filters_and_table()
+        self._set_all_bands(False)
     
     def _needed_toggle_changed(self, e):
         """Handle needed-only toggle change"""
         self.show_needed_only = e.control.value
         self._rebuild_table()
     
-    def _rebuild_filters_and_table(self):
-        """Rebuild both filters and table (for All/None buttons)"""
-        self.controls = [
-            self._build_summary(),
-            ft.Divider(height=10),
-            self._build_filters(),
-            ft.Divider(height=10),
-            self._build_table(),
-        ]
-        try:
-            self.update()
-        except:
-            pass
+    def _set_all_bands(self, value):
+        """Tick or untick every band checkbox, then rebuild the table (for All/None buttons)"""
+        for band, check in self._band_checkboxes.items():
+            self.selected_bands[band] = value
+            check.value = value
+        # One update() sends the checkbox changes along with the new table
+        self._rebuild_table()
     
     def _build_table(self):
         """Build the entity x band grid with filters and sorting"""
+        self._table = None
         if not self.challenge_data:
             return ft.Container(
                 content=ft.Column([
@@ -280,115 +466,59 @@ class ChallengeTable(ft.Column):
                 padding=20,
             )
         
-        # Build header row with clickable sort buttons
-        # Show arrow on active column: ▲ for ascending, ▼ for descending
-        country_arrow = ""
-        prefix_arrow = ""
-        
-        if self.sort_by == 'country':
-            country_arrow = " ▲" if not self.sort_reverse else " ▼"
-        else:  # prefix
-            prefix_arrow = " ▲" if not self.sort_reverse else " ▼"
+        # Build header row with clickable sort buttons (labels set below)
+        self._country_button = ft.TextButton(on_click=self._sort_by_country)
+        self._prefix_button = ft.TextButton(on_click=self._sort_by_prefix)
+        self._set_sort_labels()
         
         columns = [
-            ft.DataColumn(
-                ft.TextButton(
-                    "Country" + country_arrow,
-                    on_click=self._sort_by_country,
-                ),
-            ),
-            ft.DataColumn(
-                ft.TextButton(
-                    "Prefix" + prefix_arrow,
-                    on_click=self._sort_by_prefix,
-                ),
-            ),
+            ft.DataColumn(self._country_button),
+            ft.DataColumn(self._prefix_button),
         ]
         
         # Add columns for selected bands only
         for band in selected_bands:
-            columns.append(ft.DataColumn(ft.Text(band, weight=ft.FontWeight.BOLD)))
+            columns.append(ft.DataColumn(ft.Text(band, weight=_BOLD)))
         
-        # Load DXCC mapping for country names
-        dxcc_mapping = self._load_dxcc_mapping()
+        # Create dict of worked entities for quick lookup
+        worked = self.challenge_data["entities"] if self.challenge_data else {}
         
-        # Get ALL 340 current DXCC entities from dxcc_entities.json
-        all_entities = self._load_all_dxcc_entities()
+        # Cells for each entity (name, prefix and all 11 bands), by position.
+        # They only change with the data, so band filter changes reuse them
+        # and just pick out the selected band cells.
+        pool_worked, pool_names = self._pool_source
+        if pool_worked is not worked or pool_names is not self._names:
+            self._cell_pool = {}
+            self._pool_source = (worked, self._names)
+        self._worked = worked
         
-        # Create dict of worked entities for quick lookup
-        worked_entities = self.challenge_data["entities"] if self.challenge_data else {}
+        # Index (into BANDS) of each selected band
+        self._band_ks = [BAND_INDEX[band] for band in selected_bands]
         
-        # Sort based on current sort_by state
-        if self.sort_by == 'country':
-            # Sort by country name
-            entities_sorted = sorted(
-                all_entities.items(),
-                key=lambda x: x[1]["name"],
-                reverse=self.sort_reverse
-            )
-        else:  # sort by prefix (default)
-            # Sort by prefix
-            entities_sorted = sorted(
-                all_entities.items(), 
-                key=lambda x: x[1]["prefix"],
-                reverse=self.sort_reverse
-            )
+        # Rows already built for this band selection, by entity position -
+        # sorting just puts them in a different order
+        self._row_cache = {}
         
-        # Build data rows with filters
-        rows = []
-        
-        for entity_num_str, entity_data in entities_sorted:
-            entity_num = int(entity_num_str)
-            bands_worked = worked_entities.get(entity_num, set())
-        
-            # Apply "Needed Only" filter
-            if self.show_needed_only:
-                # Check if entity is missing ANY of the selected bands
-                has_needed = False
-                for band in selected_bands:
-                    if band not in bands_worked:
-                        has_needed = True
-                        break
-                
-                if not has_needed:
-                    continue  # Skip this entity - all selected bands worked
-            
-            country_name = entity_data["name"]
-            prefix = entity_data["prefix"]
-            
-            # Truncate long names
-            if len(country_name) > 25:
-                country_name = country_name[:22] + "..."
-            
-            cells = [
-                ft.DataCell(ft.Text(country_name, size=12)),
-                ft.DataCell(ft.Text(prefix, size=12, weight=ft.FontWeight.BOLD)),
-            ]
-            
-            # Add checkmarks for selected bands only
-            for band in selected_bands:
-                if band in bands_worked:
-                    cells.append(ft.DataCell(ft.Text("✓", color=ft.Colors.GREEN, weight=ft.FontWeight.BOLD)))
-                else:
-                    cells.append(ft.DataCell(ft.Text("", size=12)))
-            
-            rows.append(ft.DataRow(cells=cells))
+        # Positions of every entity to show, in display order. Rows are only
+        # built for the first batch here; the rest come in as the user scrolls.
+        self._visible = self._visible_order()
+        rows = [self._get_row(i) for i in self._visible[:ROW_BATCH]]
         
         # Show count
         count_text = ft.Text(
-            f"Showing {len(rows)} entities" + (" (needed only)" if self.show_needed_only else ""),
+            f"Showing {len(self._visible)} entities" + (" (needed only)" if self.show_needed_only else ""),
             size=12,
             color=ft.Colors.BLUE_GREY_400,
         )
         
-        table = ft.DataTable(
+        self._table = ft.DataTable(
             columns=columns,
             rows=rows,
             column_spacing=10,
             heading_row_height=40,
             data_row_max_height=32,
-            border=ft.border.all(1, ft.Colors.GREY_700),
-            heading_row_color=ft.Colors.BLUE_GREY_800,
+            border=_TABLE_BORDER,
+            heading_row_color=_HEAD_COLOR,
         )
         
         return ft.Container(
@@ -396,79 +526,77 @@ class ChallengeTable(ft.Column):
                 count_text,
                 ft.Container(height=5),
                 ft.ListView(
-                    controls=[table],
+                    controls=[self._table],
                     expand=True,
+                    on_scroll=self._on_table_scroll,
                 ),
             ]),
             expand=True,
         )
     
-    def _load_dxcc_mapping(self):
-        """Load DXCC number -> country name mapping"""
-        mapping_file = get_dxcc_mapping_file()
-        if mapping_file.exists():
-            try:
-                return json.loads(mapping_file.read_text())
-            except:
-                pass
-        return {}
+    def _set_sort_labels(self):
+        """Show arrow on active column: ▲ for ascending, ▼ for descending"""
+        arrow = " ▼" if self.sort_reverse else " ▲"
+        self._country_button.text = "Country" + (arrow if self.sort_by == 'country' else "")
+        self._prefix_button.text = "Prefix" + (arrow if self.sort_by == 'prefix' else "")
+    
+    def _visible_order(self):
+        """Positions of the entities to show, in the current sort order"""
+        # ALL 340 current DXCC entities, pre-sorted by country or prefix
+        order = self._orderings[self.sort_by]
+        if self.sort_reverse:
+            order = reversed(order)
         
-    def _load_all_dxcc_entities(self):
-        """Load all 340 current DXCC entities from dxcc_entities.json"""
-        entities_file = get_dxcc_entities_file()
-        if entities_file.exists():
-            try:
-                data = json.loads(entities_file.read_text(encoding='utf-8'))
-                
-                # Load name overrides
-                overrides = self._load_name_overrides()
-                
-                # Filter to only current (not deleted) entities
-                current = {}
-                for dxcc_num, entity_data in data.items():
-                    if entity_data.get("current", False):
-                        # Apply name override if exists
-                        if dxcc_num in overrides:
-                            entity_data = entity_data.copy()  # Don't modify original
-                            entity_data["name"] = overrides[dxcc_num]
-                        current[dxcc_num] = entity_data
-                
-                return current
-            except Exception as e:
-                print(f"Error loading dxcc_entities.json: {e}")
+        # Apply "Needed Only" filter - skip entities with all selected bands worked
+        if self.show_needed_only:
+            worked = self._worked
+            entity_nums = self._entity_nums
+            selected_mask = sum(1 << k for k in self._band_ks)
+            return [
+                i for i in order
+                if worked.get(entity_nums[i], 0) & selected_mask != selected_mask
+            ]
+        return list(order)
+    
+    def _get_row(self, i):
+        """DataRow for the entity at position i, building it on first use"""
+        row = self._row_cache.get(i)
+        if row is None:
+            row = self._row_cache[i] = self._build_row(i)
+        return row
+    
+    def _build_row(self, i):
+        """Build the DataRow for the entity at position i"""
+        cells = self._cell_pool.get(i)
+        if cells is None:
+            bands_worked = self._worked.get(self._entity_nums[i], 0)
+            cells = self._cell_pool[i] = (
+                ft.DataCell(ft.Text(self._display_names[i], size=12)),
+                ft.DataCell(ft.Text(self._prefixes[i], size=12, weight=_BOLD)),
+                [_check_cell() if bands_worked & (1 << k) else _empty_cell() for k in range(len(BANDS))],
+            )
+        name_cell, prefix_cell, band_cells = cells
         
-        # Fallback to old method if file doesn't exist
-        return self._load_dxcc_mapping_fallback()
+        # Checkmarks for selected bands only
+        return ft.DataRow(cells=[name_cell, prefix_cell, *[band_cells[k] for k in self._band_ks]])
     
-    def _load_name_overrides(self):
-        """Load DXCC name overrides (ARRL preferred names)"""
-        override_file = get_dxcc_overrides_file()
-        if override_file.exists():
-            try:
-                return json.loads(override_file.read_text(encoding='utf-8'))
-            except Exception as e:
-                print(f"Error loading name overrides: {e}")
-        return {}
-    
-    def _load_dxcc_mapping_fallback(self):
-        """Fallback to old dxcc_mapping.json format"""
-        mapping_file = get_dxcc_mapping_file()
-        if mapping_file.exists():
-            try:
-                mapping = json.loads(mapping_file.read_text())
-                
-                # Convert to entity format
-                entities = {}
-                for dxcc_num, name in mapping.items():
-                    entities[dxcc_num] = {
-                        "name": name,
-                        "prefix": get_prefix(int(dxcc_num)),
-                        "current": True
-                    }
-                return entities
-            except:
-                pass
-        return {}
+    def _on_table_scroll(self, e):
+        """Add the next batch of rows when scrolled close to the bottom"""
+        table = getattr(self, "_table", None)
+        if table is None:
+            return
+        
+        built = len(table.rows)
+        if built >= len(self._visible):
+            return  # Everything is already showing
+        if e.pixels < e.max_scroll_extent - SCROLL_LOAD_MARGIN:
+            return
+        
+        table.rows.extend(self._get_row(i) for i in self._visible[built:built + ROW_BATCH])
+        try:
+            table.update()
+        except:
+            pass
     
     def _sort_by_country(self, e):
         """Sort table by country name - toggle direction if already sorting by country"""
@@ -479,7 +607,7 @@ class ChallengeTable(ft.Column):
             # Switching to country sort, default to ascending
             self.sort_by = 'country'
             self.sort_reverse = False
-        self._rebuild_table()
+        self._resort_table()
     
     def _sort_by_prefix(self, e):
         """Sort table by prefix - toggle direction if already sorting by prefix"""
@@ -490,7 +618,25 @@ class ChallengeTable(ft.Column):
             # Switching to prefix sort, default to ascending
             self.sort_by = 'prefix'
             self.sort_reverse = False
-        self._rebuild_table()
+        self._resort_table()
+    
+    def _resort_table(self):
+        """Re-order the existing table rows after a sort change"""
+        table = self._table
+        if table is None:
+            self._rebuild_table()
+            return
+        
+        # Same entities and columns, just a new order - reuse the rows
+        # already built and keep as many showing as before
+        self._set_sort_labels()
+        self._visible = self._visible_order()
+        shown = max(len(table.rows), ROW_BATCH)
+        table.rows = [self._get_row(i) for i in self._visible[:shown]]
+        try:
+            table.update()
+        except:
+            pass
     
     def _rebuild_table(self):
         """Rebuild just the table portion"""
@@ -503,14 +649,28 @@ class ChallengeTable(ft.Column):
     
     def refresh(self):
         """Reload challenge data and rebuild table"""
-        self.challenge_data = self._load_challenge_data()
-        self.controls = [
-            self._build_summary(),
-            ft.Divider(height=10),
-            self._build_filters(),
-            ft.Divider(height=10),
-            self._build_table(),
-        ]
+        with self._load_lock:
+            # Nothing changed on disk since the last load - keep what's showing
+            stamp = self._data_files_stamp()
+            if self._loaded and stamp == self._files_stamp:
+                return
+            self._files_stamp = stamp
+            
+            self.challenge_data = self._load_challenge_data()
+            _clear_dxcc_caches()
+            self._load_reference_data()
+            
+            # Build UI - the summary only depends on the challenge data, so keep
+            # it around and reuse it when the filters/table are rebuilt
+            self._summary_widget = self._build_summary()
+            self.controls = [
+                self._summary_widget,
+                ft.Divider(height=10),
+                self._build_filters(),
+                ft.Divider(height=10),
+                self._build_table(),
+            ]
+            self._loaded = True
         try:
             self.update()
         except:
@@ -1,7 +1,29 @@
 # command_response_display.py - Compact horizontal command/response display
 import flet as ft
+import re
+import time
 from collections import deque
-from datetime import datetime
+
+# Login prompts and dividers - not worth showing
+_SKIP_RE = re.compile(r"please enter|login:|----|de n4lr", re.IGNORECASE)
+# Color coding for responses
+_OK_RE = re.compile(r"filter|set", re.IGNORECASE)
+_ERR_RE = re.compile(r"error|failed", re.IGNORECASE)
+
+# How many messages to keep on screen / in history
+MAX_MESSAGES = 10
+
+# Last formatted timestamp - bursts of cluster lines land in the same second
+_last_stamp = (None, "")
+
+
+def _timestamp():
+    """Local HH:MM:SS, only re-formatted when the second changes"""
+    global _last_stamp
+    now = int(time.time())
+    if _last_stamp[0] != now:
+        _last_stamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _last_stamp[1]
 
 
 class CommandResponseDisplay(ft.Container):
@@ -11,7 +33,7 @@ class CommandResponseDisplay(ft.Container):
         super().__init__()
         
         # Store last 10 messages
-        self.message_history = deque(maxlen=10)
+        self.message_history = deque(maxlen=MAX_MESSAGES)
         
         # Scrollable message display (horizontal)
         self.message_display = ft.ListView(
@@ -46,66 +68,45 @@ class CommandResponseDisplay(ft.Container):
     
     def add_command(self, command: str):
         """Add a sent command to the display"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        # Add to history
-        self.message_history.append({
-            "type": "command",
-            "text": command.strip(),
-            "time": timestamp,
-        })
-        
-        # Add to UI - compact format
-        self.message_display.controls.append(
-            ft.Text(
-                f"{timestamp} → {command.strip()}",
-                size=10,
-                color=ft.Colors.CYAN_300,
-                no_wrap=False,
-            )
-        )
-        
-        # Keep only last 10 items
-        if len(self.message_display.controls) > 10:
-            self.message_display.controls.pop(0)
-        
-        try:
-            self.update()
-        except:
-            pass
+        self._add_message("command", command.strip(), "→", ft.Colors.CYAN_300)
     
     def add_response(self, response: str):
         """Add a server response to the display"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
         # Skip empty responses
-        if not response.strip():
+        text = response.strip()
+        if not text:
             return
         
         # Skip login prompts and dividers
-        response_lower = response.lower()
-        if any(skip in response_lower for skip in ["please enter", "login:", "----", "de n4lr"]):
+        if _SKIP_RE.search(response):
             return
         
-        # Add to history
-        self.message_history.append({
-            "type": "response",
-            "text": response.strip(),
-            "time": timestamp,
-        })
-        
         # Color code based on content
-        if "filter" in response_lower or "set" in response_lower:
+        if _OK_RE.search(response):
             color = ft.Colors.GREEN_300  # Success messages
-        elif "error" in response_lower or "failed" in response_lower:
+        elif _ERR_RE.search(response):
             color = ft.Colors.RED_300  # Errors
         else:
             color = ft.Colors.BLUE_GREY_300  # Info
         
+        self._add_message("response", text, "←", color)
+    
+    def _add_message(self, kind, text, arrow, color):
+        """Record a command/response and show it, keeping only the last MAX_MESSAGES"""
+        timestamp = _timestamp()
+        
+        # Add to history (deque drops the oldest itself)
+        self.message_history.append({
+            "type": kind,
+            "text": text,
+            "time": timestamp,
+        })
+        
         # Add to UI - compact format
-        self.message_display.controls.append(
+        controls = self.message_display.controls
+        controls.append(
             ft.Text(
-                f"{timestamp} ← {response.strip()}",
+                f"{timestamp} {arrow} {text}",
                 size=10,
                 color=color,
                 no_wrap=False,
@@ -113,8 +114,8 @@ class CommandResponseDisplay(ft.Container):
         )
         
         # Keep only last 10 items
-        if len(self.message_display.controls) > 10:
-            self.message_display.controls.pop(0)
+        if len(controls) > MAX_MESSAGES:
+            del controls[:-MAX_MESSAGES]
         
         try:
             self.update()
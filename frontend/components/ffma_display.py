@@ -1,47 +1,92 @@
 # ffma_table.py - ARRL FFMA (Fred Fish Memorial Award) progress display
 import flet as ft
+import threading
 from backend.ffma_tracking import get_ffma_stats, load_ffma_grids
-import json
+from backend.file_paths import get_ffma_data_file
 from pathlib import Path
 
 from backend.app_logging import get_logger
 
 logger = get_logger(__name__)
 
+# Only ~20 rows fit on screen, so the table starts with the first
+# ROW_BATCH grids and adds another batch each time it's scrolled near the end
+ROW_BATCH = 60
+SCROLL_LOAD_MARGIN = 400  # pixels from the bottom
+
 class FFMADisplay(ft.Column):
     """Display FFMA progress - 488 grids on 6 meters"""
     
     def __init__(self):
         super().__init__()
         
-        # Load FFMA data
-        self.ffma_data = self._load_ffma_data()
-        
-        # Load FFMA grids
-        #try:
-        #print("DEBUG FFMA_TABLE: About to call load_ffma_grids()")
+        # FFMA data and grids are loaded in the background (see _initial_load)
+        self._data_stamp = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self.ffma_data = None
+        self.ffma_grids = None
+        self._table = None
         
-        self.ffma_grids = load_ffma_grids()
-        
-        # Build UI
+        # Placeholder until the JSON files are read - that happens off the
+        # UI thread so the app window isn't held up at startup
         self.controls = [
-            self._build_summary(),
-            ft.Divider(height=20),
-            self._build_table(),
+            ft.Row([
+                ft.ProgressRing(width=20, height=20),
+                ft.Text("Loading FFMA data...", size=14),
+            ], spacing=10),
         ]
         
         self.scroll = ft.ScrollMode.AUTO
         self.expand = True
+        # Whichever of us or the table's ListView ends up scrolling,
+        # keep loading rows as the user gets near the bottom
+        self.on_scroll = self._on_table_scroll
+        
+        threading.Thread(target=self._initial_load, daemon=True).start()
+    
+    def _initial_load(self):
+        """Load FFMA data/grids and build the UI (runs in a background thread)"""
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"Error loading FFMA display: {e}")
+    
+    def did_mount(self):
+        super().did_mount()
+        # The background load may have finished before we were on the page,
+        # in which case its update() went nowhere
+        if self._loaded:
+            try:
+                self.update()
+            except:
+                pass
+    
+    def _ffma_data_stamp(self):
+        """(mtime, size) of ffma_data.json, or None if it doesn't exist"""
+        try:
+            st = get_ffma_data_file().stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
     
     def _load_ffma_data(self):
         """Load FFMA data from JSON"""
         stats = get_ffma_stats()
-        logger.info("DEBUG: _load_ffma_data {stats}")
+        logger.debug("_load_ffma_data: %s", stats)
+        
+        # Format dates once here (YYYY-MM-DD -> MM/DD/YY for compactness)
+        # so table rebuilds just read them
+        for info in stats.get("worked_grids", {}).values():
+            date = info.get("date", "")
+            if date and len(date) == 10 and date[4] == '-' and date[7] == '-':
+                date = f"{date[5:7]}/{date[8:10]}/{date[2:4]}"
+            info["date_fmt"] = date
         return stats
     
     def _build_summary(self):
         """Build summary statistics"""
-        logger.info("DEBUG: Start _build_summary statistics")
+        logger.debug("Start _build_summary statistics")
         if not self.ffma_data:
             return ft.Text("No FFMA data loaded", size=16, color=ft.Colors.RED)
         
@@ -78,9 +123,10 @@ class FFMADisplay(ft.Column):
     
     def _build_table(self):
         """Build the grid table"""
-        logger.info("DEBUG: Start build_summary statistics")
+        logger.debug("Start _build_table")
+        self._table = None
         if not self.ffma_grids:
-            logger.info("DEBUG: ERROR FFMA grid list loaded")
+            logger.warning("FFMA grid list not loaded")
             return ft.Text("FFMA grid list not loaded", color=ft.Colors.RED)
         
         # Build header row
@@ -90,51 +136,12 @@ class FFMADisplay(ft.Column):
             ft.DataColumn(ft.Text("Date", weight=ft.FontWeight.BOLD)),
         ]
         
-        # Build data rows
-        rows = []
-        worked_grids = self.ffma_data.get("worked_grids", {})
-        
-        # Sort grids alphabetically
-        sorted_grids = sorted(self.ffma_grids)
-        
-        for grid in sorted_grids:
-            # Check if worked
-            if grid in worked_grids:
-                info = worked_grids[grid]
-                callsign = info.get("call", "")
-                date = info.get("date", "")
-                
-                # Format date (YYYY-MM-DD -> MM/DD/YY for compactness)
-                if date and len(date) == 10:
-                    try:
-                        parts = date.split('-')
-                        date = f"{parts[1]}/{parts[2]}/{parts[0][2:]}"
-                    except:
-                        pass
-                
-                # Worked - green background on grid cell only
-                grid_cell = ft.DataCell(
-                    ft.Container(
-                        content=ft.Text(grid, size=12, color=ft.Colors.BLACK, weight=ft.FontWeight.BOLD),
-                        bgcolor=ft.Colors.GREEN_400,
-                        padding=5,
-                        border_radius=3,
-                    )
-                )
-                call_cell = ft.DataCell(ft.Text(callsign, size=12, weight=ft.FontWeight.BOLD))
-                date_cell = ft.DataCell(ft.Text(date, size=11, color=ft.Colors.BLUE_GREY_400))
-                row_color = None
-            else:
-                # Not worked yet - red text for grid
-                grid_cell = ft.DataCell(ft.Text(grid, size=12, color=ft.Colors.RED_400, weight=ft.FontWeight.BOLD))
-                call_cell = ft.DataCell(ft.Text("", size=12))
-                date_cell = ft.DataCell(ft.Text("", size=11))
-                row_color = None
-            
-            cells = [grid_cell, call_cell, date_cell]
-            rows.append(ft.DataRow(cells=cells, color=row_color))
+        # Build data rows - just the first batch, the rest come in on scroll
+        # (grids sorted alphabetically, done once on load)
+        self._worked_grids = self.ffma_data.get("worked_grids", {})
+        rows = [self._build_grid_row(grid) for grid in self._sorted_grids[:ROW_BATCH]]
         
-        table = ft.DataTable(
+        self._table = ft.DataTable(
             columns=columns,
             rows=rows,
             column_spacing=20,
@@ -146,22 +153,75 @@ class FFMADisplay(ft.Column):
         
         return ft.Container(
             content=ft.ListView(
-                controls=[table],
+                controls=[self._table],
                 expand=True,
+                on_scroll=self._on_table_scroll,
             ),
             expand=True,
         )
     
+    def _build_grid_row(self, grid):
+        """Build the DataRow for one FFMA grid"""
+        info = self._worked_grids.get(grid)
+        if info is not None:
+            # Worked - green background on grid cell only
+            grid_cell = ft.DataCell(
+                ft.Container(
+                    content=ft.Text(grid, size=12, color=ft.Colors.BLACK, weight=ft.FontWeight.BOLD),
+                    bgcolor=ft.Colors.GREEN_400,
+                    padding=5,
+                    border_radius=3,
+                )
+            )
+            call_cell = ft.DataCell(ft.Text(info.get("call", ""), size=12, weight=ft.FontWeight.BOLD))
+            date_cell = ft.DataCell(ft.Text(info.get("date_fmt", ""), size=11, color=ft.Colors.BLUE_GREY_400))
+        else:
+            # Not worked yet - red text for grid
+            grid_cell = ft.DataCell(ft.Text(grid, size=12, color=ft.Colors.RED_400, weight=ft.FontWeight.BOLD))
+            call_cell = ft.DataCell(ft.Text("", size=12))
+            date_cell = ft.DataCell(ft.Text("", size=11))
+        
+        return ft.DataRow(cells=[grid_cell, call_cell, date_cell])
+    
+    def _on_table_scroll(self, e):
+        """Add the next batch of grid rows when scrolled close to the bottom"""
+        table = getattr(self, "_table", None)
+        if table is None:
+            return
+        
+        built = len(table.rows)
+        if built >= len(self._sorted_grids):
+            return  # Everything is already showing
+        if e.pixels < e.max_scroll_extent - SCROLL_LOAD_MARGIN:
+            return
+        
+        table.rows.extend(self._build_grid_row(g) for g in self._sorted_grids[built:built + ROW_BATCH])
+        try:
+            table.update()
+        except:
+            pass
+    
     def refresh(self):
         """Reload FFMA data and rebuild table"""
-        logger.info("DEBUG: Reload FFMA data and rebuild table")
-        self.ffma_data = self._load_ffma_data()
-        self.ffma_grids = load_ffma_grids()
-        self.controls = [
-            self._build_summary(),
-            ft.Divider(height=20),
-            self._build_table(),
-        ]
+        logger.debug("Reload FFMA data and rebuild table")
+        
+        with self._load_lock:
+            # ffma_data.json unchanged since the last load - keep what's showing
+            # (the grid list itself is loaded once per run by load_ffma_grids)
+            stamp = self._ffma_data_stamp()
+            if self._loaded and stamp == self._data_stamp:
+                return
+            self._data_stamp = stamp
+            
+            self.ffma_data = self._load_ffma_data()
+            self.ffma_grids = load_ffma_grids()
+            self._sorted_grids = sorted(self.ffma_grids)
+            self.controls = [
+                self._build_summary(),
+                ft.Divider(height=20),
+                self._build_table(),
+            ]
+            self._loaded = True
         try:
             self.update()
         except:
@@ -1,44 +1,70 @@
 import flet as ft
+import functools
+import itertools
+import re
+import threading
 import time
-from datetime import datetime, timedelta
-from backend.config import get_voice_alert_list
+from collections import OrderedDict
+from backend.config import (
+    get_voice_alert_list, get_watch_list, get_grid_chasing_enabled, get_blocked_spotters
+)
+from backend.app_logging import get_logger
+
+logger = get_logger(__name__)
 
 
 try:
     from backend.lotw_users import is_lotw_user, get_upload_age_days
     LOTW_AVAILABLE = True
-except:
+except ImportError:
     LOTW_AVAILABLE = False
     print("LoTW user lookup not available")
 
 try:
     from backend.dxcc_challenge import is_needed
     CHALLENGE_AVAILABLE = True
-except:
+except ImportError:
     CHALLENGE_AVAILABLE = False
     print("DXCC Challenge module not available")
 
 try:
     from backend.dxcc_lookup import lookup_dxcc_from_prefix
+    # cty.dat is loaded once at startup, so prefix -> entity never changes
+    _lookup_dxcc_from_prefix = functools.lru_cache(maxsize=4096)(lookup_dxcc_from_prefix)
     DXCC_LOOKUP_AVAILABLE = True
-except:
+except ImportError:
     DXCC_LOOKUP_AVAILABLE = False
     print("DXCC lookup not available")
 
 try:
     from backend.ffma_tracking import is_grid_needed
     FFMA_AVAILABLE = True
-except:
+except ImportError:
     FFMA_AVAILABLE = False
     print("FFMA tracking module not available")
 
 try:
     from backend.config import load_config
     CONFIG_AVAILABLE = True
-except:
+except ImportError:
     CONFIG_AVAILABLE = False
     print("Config module not available")
 
+# LoTW marker in front of the call: none, active (uploaded in last 90 days), inactive
+LOTW_NONE, LOTW_ACTIVE, LOTW_INACTIVE = 0, 1, 2
+_LOTW_MARK_COLOR = {LOTW_ACTIVE: ft.Colors.GREEN, LOTW_INACTIVE: ft.Colors.ORANGE}
+
+
+def _build_call_display(call: str, lotw_state: int, text_color, bold: bool):
+    """Call cell content - the call, with a green/orange + for LoTW users"""
+    call_text = ft.Text(call, color=text_color, weight=ft.FontWeight.BOLD if bold else None)
+    if lotw_state == LOTW_NONE:
+        return call_text
+    return ft.Row([
+        ft.Text("+", color=_LOTW_MARK_COLOR[lotw_state], weight=ft.FontWeight.BOLD),
+        call_text,
+    ], spacing=2)
+
 
 class LiveSpotTable(ft.Column):
     """Live DX spot table with basic filters and separate needed spots buffer."""
@@ -48,14 +74,14 @@ class LiveSpotTable(ft.Column):
         
         # Two separate buffers
         self.regular_spots: list[dict] = []  # Regular spots (100 max)
-        self.needed_spots: list[dict] = []   # Needed spots (kept longer)
+        # Needed spots (kept longer), newest first - keyed by (call, band) so a
+        # re-spot replaces the older one without scanning the buffer
+        self.needed_spots: OrderedDict[tuple, dict] = OrderedDict()
         
         # Grid chasing enabled flag
-        from backend.config import get_grid_chasing_enabled
         self.grid_chasing_enabled = get_grid_chasing_enabled()
         
         # Watch list
-        from backend.config import get_watch_list
         self.watch_list = set(get_watch_list())  # Use set for O(1) lookup
         
         # Voice alert list
@@ -63,13 +89,17 @@ class LiveSpotTable(ft.Column):
         
         # Initialize with all bands selected by default
         self.filter_bands: list[str] = ["160M", "80M", "60M", "40M", "30M", "20M", "17M", "15M", "12M", "10M", "6M"]
+        self._filter_bands_set = frozenset(self.filter_bands)  # For the per-spot check
         self.filter_grid: str = ""
         self.filter_dxcc: str = ""
+        self._filter_dxcc_set: frozenset = frozenset()  # Comma separated DXCC tokens
+        self._filter_dxcc_search = None  # Compiled substring match for the same tokens
         self.filter_lotw_only: bool = False
         self.filter_needed_only: bool = False
         
         # Buffer sizes
         self.max_regular_spots: int = 100
+        self.max_visible_rows: int = 150  # Rows past this are never scrolled to anyway
         self.needed_spot_minutes: int = 15  # Keep needed spots for 15 minutes
         
         # Load needed spot duration from config
@@ -81,18 +111,27 @@ class LiveSpotTable(ft.Column):
                 pass
         
         # Load blocked spotters from config
-        self.blocked_spotters = []
+        self.blocked_spotters = frozenset()
         if CONFIG_AVAILABLE:
             try:
-                from backend.config import get_blocked_spotters
-                self.blocked_spotters = get_blocked_spotters()
+                self.blocked_spotters = frozenset(get_blocked_spotters())
             except:
                 pass
         
-        # Batching for performance - rebuild at most every N seconds
-        self.last_rebuild_time: float = 0
-        self.rebuild_interval: float = 2.0  # Rebuild every 2 seconds max
-        self.needs_rebuild: bool = False
+        # Batching for performance - push new rows to the page at most every N seconds.
+        # The first spot of a burst starts a timer, everything arriving before it
+        # fires goes out in the same table.update()
+        self.rebuild_interval: float = 2.0  # Update every 2 seconds max
+        self._flush_timer: threading.Timer | None = None
+        self._rows_lock = threading.RLock()  # Timer thread vs. spot handler
+        self._rows_dirty: bool = False  # Rows changed since the page last saw them
+        
+        # Row currently shown for each spot, keyed by id(spot) - lets add_spot
+        # insert/remove single rows instead of rebuilding the whole table
+        self._row_for_spot: dict[int, ft.DataRow] = {}
+        # Every row built for a spot still in the buffers, shown or filtered out,
+        # keyed by id(spot) -> (highlight state, row). Filter changes reuse these.
+        self._row_cache: dict[int, tuple] = {}
         
         self.table = ft.DataTable(
             columns=[
@@ -124,37 +163,38 @@ class LiveSpotTable(ft.Column):
     def set_grid_chasing_enabled(self, enabled):
         """Enable or disable grid chasing highlights"""
         self.grid_chasing_enabled = enabled
-        self._rebuild_table()  # Refresh display
+        self._rebuild_rows()  # Refresh display
         
     def refresh_watch_list(self):
         """Reload watch list from config"""
-        from backend.config import get_watch_list
         self.watch_list = set(get_watch_list())
-        self._rebuild_table()
+        self._rebuild_rows()
         
     def refresh_voice_alert_list(self):
         """Reload voice alert list from config"""
-        from backend.config import get_voice_alert_list
         self.voice_alert_list = set(get_voice_alert_list())
     
     def set_needed_spot_duration(self, minutes: int):
         """Update how long to keep needed spots"""
         self.needed_spot_minutes = minutes
-        self._clean_old_needed_spots()
-        self._schedule_rebuild()
+        self._schedule_rebuild()  # Ages the needed buffer with the new duration
     
-    def _clean_old_needed_spots(self):
-        """Remove needed spots older than configured duration"""
+    def _clean_old_needed_spots(self) -> list[dict]:
+        """Remove needed spots older than configured duration, returns the removed spots"""
         if not self.needed_spots:
-            return
-        
-        cutoff_time = datetime.now() - timedelta(minutes=self.needed_spot_minutes)
-        
-        # Keep spots that have a timestamp and are newer than cutoff
-        self.needed_spots = [
-            spot for spot in self.needed_spots
-            if spot.get('timestamp') and spot['timestamp'] > cutoff_time
-        ]
+            return []
+        
+        cutoff_time = time.monotonic() - self.needed_spot_minutes * 60
+        
+        # Newest first, so the expired spots are all at the end
+        expired = []
+        while self.needed_spots:
+            oldest = self.needed_spots[next(reversed(self.needed_spots))]
+            if oldest['timestamp'] > cutoff_time:
+                break
+            self.needed_spots.popitem(last=True)
+            expired.append(oldest)
+        return expired
     
     def add_spot(self, spot: dict):
         """Add spot to appropriate buffer and rebuild if enough time has passed"""
@@ -170,14 +210,21 @@ class LiveSpotTable(ft.Column):
         #    self._debug_printed = True
         
         # Add timestamp for age tracking
-        spot['timestamp'] = datetime.now()
+        spot['timestamp'] = time.monotonic()
+        
+        # Uppercase the fields the filters look at once here, not on every rebuild
+        spot['_band_u'] = str(spot.get("band", "")).upper()
+        spot['_grid_u'] = str(spot.get("grid", "")).upper()
+        spot['_dxcc_u'] = str(spot.get("dxcc", "")).upper()
+        spot['_call_u'] = str(spot.get("call", "")).upper()
+        spot['_spotter_u'] = str(spot.get("spotter", "")).upper()
         
         # Check if callsign is on watch list
         call = spot.get("call", "")
-        is_on_watch_list = call.upper() in self.watch_list
+        is_on_watch_list = spot['_call_u'] in self.watch_list
         
         # Check if callsign is on voice alert list
-        is_on_voice_alert = call.upper() in self.voice_alert_list
+        is_on_voice_alert = spot['_call_u'] in self.voice_alert_list
         
         # Trigger voice alert if on list
         if is_on_voice_alert:
@@ -190,65 +237,124 @@ class LiveSpotTable(ft.Column):
                 logger.error(f"Voice alert failed: {e}")
         
         # Check if this spot is needed for Challenge
+        dxcc_num = None
         is_spot_needed_challenge = False
         if CHALLENGE_AVAILABLE and DXCC_LOOKUP_AVAILABLE:
             try:
                 # Convert prefix to DXCC number
                 dxcc_prefix = spot.get("dxcc", "")
-                dxcc_num = lookup_dxcc_from_prefix(dxcc_prefix) if dxcc_prefix else None
+                dxcc_num = _lookup_dxcc_from_prefix(dxcc_prefix) if dxcc_prefix else None
                 
                 if dxcc_num:
                     is_spot_needed_challenge = is_needed(dxcc_num, spot.get("band", ""))
-            except:
-                pass
+            except Exception as e:
+                logger.debug(f"Challenge lookup failed for {call}: {e}")
         
         # Check if this spot is needed for FFMA
         is_spot_needed_ffma = False
-        if FFMA_AVAILABLE and spot.get("band", "").upper() == "6M":
+        if FFMA_AVAILABLE and spot['_band_u'] == "6M":
             try:
                 grid = spot.get("grid", "")
                 if grid:
                     is_spot_needed_ffma = is_grid_needed(grid)
-            except:
-                pass
+            except Exception as e:
+                logger.debug(f"FFMA lookup failed for {call}: {e}")
         
-        # Add to appropriate buffer (watch list, Challenge, or FFMA needed goes to needed buffer)
-        if is_on_watch_list or is_spot_needed_challenge or is_spot_needed_ffma:
+        # LoTW status for the call indicator and the LoTW only filter
+        lotw_user = False
+        lotw_age = None
+        if LOTW_AVAILABLE:
+            try:
+                lotw_user = is_lotw_user(call)
+                if lotw_user:
+                    lotw_age = get_upload_age_days(call)
+            except Exception as e:
+                logger.debug(f"LoTW lookup failed for {call}: {e}")
+        
+        # Keep the lookups on the spot so rebuilds don't repeat them - the
+        # filters and rows only read these and the *_AVAILABLE flags, so the
+        # per-row loops never need a try/except
+        spot['_dxcc_num'] = dxcc_num
+        spot['_needed_challenge'] = is_spot_needed_challenge
+        spot['_needed_ffma'] = is_spot_needed_ffma
+        spot['_lotw'] = lotw_user
+        spot['_lotw_age'] = lotw_age
+        # Uploaded in the last 90 days (0 = today, which is still active)
+        if not lotw_user:
+            spot['_lotw_state'] = LOTW_NONE
+        elif lotw_age is not None and lotw_age <= 90:
+            spot['_lotw_state'] = LOTW_ACTIVE
+        else:
+            spot['_lotw_state'] = LOTW_INACTIVE
+        
+        # Buffers and rows change together under the lock - the flush timer and
+        # filter rebuilds (UI thread) walk the same buffers
+        with self._rows_lock:
+            # Add to appropriate buffer (watch list, Challenge, or FFMA needed goes to needed buffer)
+            if is_on_watch_list or is_spot_needed_challenge or is_spot_needed_ffma:
  
-            # Remove any existing spot with same callsign+band from needed buffer
-            call = spot.get("call", "")
-            band = spot.get("band", "")
-            self.needed_spots = [
-                s for s in self.needed_spots
-                if not (s.get("call") == call and s.get("band") == band)
-            ]
+                # Remove any existing spot with same callsign+band from needed buffer
+                key = (spot.get("call", ""), spot.get("band", ""))
+                old = self.needed_spots.pop(key, None)
+                dropped = [old] if old is not None else []
             
-            # Add new spot to needed spots buffer
-            self.needed_spots.insert(0, spot)
-            # Clean old needed spots
-            self._clean_old_needed_spots()
-        else:
-            # Add to regular spots buffer
-            self.regular_spots.insert(0, spot)
-            if len(self.regular_spots) > self.max_regular_spots:
-                self.regular_spots = self.regular_spots[:self.max_regular_spots]
-        
-        # Check if enough time has passed since last rebuild
-        current_time = time.time()
-        if current_time - self.last_rebuild_time >= self.rebuild_interval:
-            self._rebuild_rows()
-            self.last_rebuild_time = current_time
-            self.needs_rebuild = False
-        else:
-            # Mark that we need a rebuild later
-            self.needs_rebuild = True
+                # Clean old needed spots
+                dropped += self._clean_old_needed_spots()
+                # Add new spot to the front of the needed spots buffer
+                self.needed_spots[key] = spot
+                self.needed_spots.move_to_end(key, last=False)
+                row_index = 0  # Needed spots go at the very top
+            else:
+                # Add to regular spots buffer
+                self.regular_spots.insert(0, spot)
+                dropped = self.regular_spots[self.max_regular_spots:]
+                del self.regular_spots[self.max_regular_spots:]
+                # Age out needed spots here too so their rows go away
+                dropped += self._clean_old_needed_spots()
+                row_index = None  # Right below the needed rows, worked out below
+        
+            # Mutate the existing rows instead of rebuilding the whole table
+            if self._drop_rows(dropped):
+                self._rows_dirty = True
+            if self._passes_filters(spot):
+                if row_index is None:
+                    row_index = sum(1 for s in self.needed_spots.values() if id(s) in self._row_for_spot)
+                row = self._get_row(spot)
+                self._row_for_spot[id(spot)] = row
+                self.table.rows.insert(row_index, row)
+                # Keep the table at max_visible_rows
+                while len(self.table.rows) > self.max_visible_rows:
+                    self._row_for_spot.pop(self.table.rows.pop().data, None)
+                self._rows_dirty = True
+            
+            # Show it with the rest of the burst when the timer fires (nothing to
+            # send if the spot was filtered out and no rows went away)
+            if self._rows_dirty and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.rebuild_interval, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush(self):
+        """Timer callback - send the rows added since the last flush to the page"""
+        with self._rows_lock:
+            self._flush_timer = None
+            if not self._rows_dirty:
+                return  # A rebuild already sent them
+            self._update_table()
     
     def set_filters(self, bands: list[str], grid: str, dxcc: str):
         """Update filters and rebuild table with current spots"""
         self.filter_bands = [b.upper() for b in bands] if bands else []
+        self._filter_bands_set = frozenset(self.filter_bands)
         self.filter_grid = (grid or "").upper()
         self.filter_dxcc = (dxcc or "").upper()
         
+        # "JA,BY" matches either - exact prefixes hit the set, the rest fall back
+        # to one compiled search instead of a substring scan per token
+        tokens = [t.strip() for t in self.filter_dxcc.split(",") if t.strip()]
+        self._filter_dxcc_set = frozenset(tokens)
+        self._filter_dxcc_search = re.compile("|".join(map(re.escape, tokens))).search if tokens else None
+        
         # Rebuild to apply new filters (don't clear - just re-filter existing spots)
         self._rebuild_rows()
     
@@ -264,7 +370,7 @@ class LiveSpotTable(ft.Column):
     
     def set_blocked_spotters(self, spotters_list):
         """Update blocked spotters list"""
-        self.blocked_spotters = [s.upper() for s in spotters_list]
+        self.blocked_spotters = frozenset(s.upper() for s in spotters_list)
         self._schedule_rebuild()
     
     def _schedule_rebuild(self):
@@ -273,189 +379,183 @@ class LiveSpotTable(ft.Column):
     
     def clear_spots(self):
         """Clear all spots from both buffers"""
-        self.regular_spots = []
-        self.needed_spots = []
-        self.table.rows = []
-        try:
-            self.table.update()
-        except:
-            pass  # Control not yet added to page
+        with self._rows_lock:
+            self.regular_spots = []
+            self.needed_spots = OrderedDict()
+            self._row_for_spot = {}
+            self._row_cache = {}
+            self.table.rows = []
+            self._update_table()
     
     def _passes_filters(self, s: dict) -> bool:
-        band = str(s.get("band", "")).upper()
-        grid = str(s.get("grid", "")).upper()
-        dxcc = str(s.get("dxcc", "")).upper()
-        call = str(s.get("call", ""))
-        
-        # Band filter: if list is empty, show NOTHING; if list has items, show only those bands
-        if len(self.filter_bands) == 0:
-            return False  # No bands selected = show nothing
+        # Uppercased copies made in add_spot. Cheapest / most selective checks first.
         
-        if band not in self.filter_bands:
+        # Band filter: if set is empty, show NOTHING; if set has items, show only those bands
+        if s['_band_u'] not in self._filter_bands_set:
             return False  # This band is not in the selected list
         
-        if self.filter_grid and not grid.startswith(self.filter_grid):
-            return False
+        # Blocked spotters filter
+        if s['_spotter_u'] in self.blocked_spotters:
+            return False  # Block this spotter
         
-        if self.filter_dxcc and self.filter_dxcc not in dxcc:
+        if self.filter_grid and not s['_grid_u'].startswith(self.filter_grid):
             return False
         
-        if band not in self.filter_bands:
-            return False  # This band is not in the selected list
-        
-        # Blocked spotters filter  # ADD THIS
-        spotter = str(s.get("spotter", "")).upper()
-        if spotter in self.blocked_spotters:
-            return False  # Block this spotter
+        if self._filter_dxcc_search:
+            dxcc = s['_dxcc_u']
+            if dxcc not in self._filter_dxcc_set and not self._filter_dxcc_search(dxcc):
+                return False
         
-        if self.filter_grid and not grid.startswith(self.filter_grid):
+        # LoTW Only filter (False when LoTW lookup isn't available)
+        if self.filter_lotw_only and not s['_lotw']:
             return False
         
-        # LoTW Only filter
-        if self.filter_lotw_only:
-            if LOTW_AVAILABLE:
-                try:
-                    if not is_lotw_user(call):
-                        return False
-                except:
-                    return False
-            else:
-                return False  # Can't filter if LoTW not available
-        
         # Needed Only filter
         if self.filter_needed_only:
             # Check if on watch list - always pass if on watch list
-            call = s.get("call", "")
-            if call.upper() in self.watch_list:
+            if s['_call_u'] in self.watch_list:
                 return True  # Watch list spots ALWAYS show
             
-            if CHALLENGE_AVAILABLE and DXCC_LOOKUP_AVAILABLE:
-                try:
-                    dxcc_prefix = s.get("dxcc", "")
-                    dxcc_num = lookup_dxcc_from_prefix(dxcc_prefix) if dxcc_prefix else None
-                    
-                    if not dxcc_num or not is_needed(dxcc_num, s.get("band", "")):
-                        return False
-                except:
-                    return False
-            else:
-                return False  # Can't filter if Challenge not available
+            if not s['_needed_challenge']:
+                return False  # Also False when Challenge lookup isn't available
         
         return True
     
     def _delete_spot(self, spot: dict):
         """Delete a specific spot from both buffers"""
         def handler(e):
-            # Remove from needed spots
-            self.needed_spots = [s for s in self.needed_spots if s is not spot]
-            # Remove from regular spots
-            self.regular_spots = [s for s in self.regular_spots if s is not spot]
-            # Rebuild table
-            self._rebuild_rows()
+            with self._rows_lock:
+                # Remove from needed spots
+                key = (spot.get("call", ""), spot.get("band", ""))
+                if self.needed_spots.get(key) is spot:
+                    del self.needed_spots[key]
+                # Remove from regular spots
+                self.regular_spots = [s for s in self.regular_spots if s is not spot]
+                # Just drop its row
+                if self._drop_rows([spot]):
+                    self._update_table()
         return handler
     
-    def _rebuild_rows(self):
-        """Rebuild table rows from both buffers, needed spots first"""
-        rows: list[ft.DataRow] = []
-        
-        # Clean old needed spots before rebuilding
-        self._clean_old_needed_spots()
-        
-        # Combine both buffers: needed spots first, then regular
-        all_spots = self.needed_spots + self.regular_spots
-        
-        for s in all_spots:
-            if not self._passes_filters(s):
-                continue
-        
-            # Check if this spot is needed for DXCC Challenge
-            needed_challenge = False
-            if CHALLENGE_AVAILABLE and DXCC_LOOKUP_AVAILABLE:
-                try:
-                    # Convert prefix to DXCC number
-                    dxcc_prefix = s.get("dxcc", "")
-                    dxcc_num = lookup_dxcc_from_prefix(dxcc_prefix) if dxcc_prefix else None
-                    
-                    if dxcc_num:
-                        needed_challenge = is_needed(dxcc_num, s.get("band", ""))
-                except:
-                    pass
-                    
-            # Check if this spot is needed for FFMA (6m grids only)
-            needed_ffma = False
-            if self.grid_chasing_enabled and FFMA_AVAILABLE and s.get("band", "").upper() == "6M":  # ADD grid_chasing_enabled check
-                try:
-                    grid = s.get("grid", "")
-                    if grid:
-                        needed_ffma = is_grid_needed(grid)
-                except:
-                    pass
-            
-            # Check if callsign is on watch list (HIGHEST PRIORITY)
-            call = s.get("call", "")
-            on_watch_list = call.upper() in self.watch_list
-            
-            # Determine highlight color (Watch List takes priority)
-            if on_watch_list:
-                highlight_color = ft.Colors.RED_400  # Watch List - RED URGENT!
-                text_color = ft.Colors.WHITE
-            elif needed_challenge:
-                highlight_color = ft.Colors.AMBER_200  # Challenge - amber
-                text_color = ft.Colors.BLACK
-            elif needed_ffma:
-                highlight_color = ft.Colors.CYAN_200  # FFMA - cyan
-                text_color = ft.Colors.BLACK
-            else:
-                highlight_color = None
-                text_color = None
-                
-            # Format callsign with LoTW indicator
-            #call = s.get("call", "")
-            if LOTW_AVAILABLE and is_lotw_user(call):
-                age_days = get_upload_age_days(call)
-                if age_days and age_days <= 90:
-                    # Active user - green +
-                    call_display = ft.Row([
-                        ft.Text("+", color=ft.Colors.GREEN, weight=ft.FontWeight.BOLD),
-                        ft.Text(call, color=text_color, weight=ft.FontWeight.BOLD if (needed_challenge or needed_ffma) else None),
-                    ], spacing=2)
-                else:
-                    # Inactive user - orange +
-                    call_display = ft.Row([
-                        ft.Text("+", color=ft.Colors.ORANGE, weight=ft.FontWeight.BOLD),
-                        ft.Text(call, color=text_color, weight=ft.FontWeight.BOLD if (needed_challenge or needed_ffma) else None),
-                    ], spacing=2)
-            else:
-                # Not a LoTW user
-                call_display = ft.Text(call, color=text_color, weight=ft.FontWeight.BOLD if (needed_challenge or needed_ffma) else None)
-        
-            # Create row with appropriate background color
-            row = ft.DataRow(
-                cells=[
-                    ft.DataCell(ft.Text(s.get("time", ""), color=text_color)),
-                    ft.DataCell(ft.Text(s.get("band", ""), color=text_color)),
-                    ft.DataCell(ft.Text(s.get("freq", ""), color=text_color)),
-                    ft.DataCell(call_display),
-                    ft.DataCell(ft.Text(s.get("dxcc", ""), color=text_color, weight=ft.FontWeight.BOLD if (needed_challenge or needed_ffma) else None)),
-                    ft.DataCell(ft.Text(s.get("grid", ""), color=text_color)),
-                    ft.DataCell(ft.Text(s.get("spotter", ""), color=text_color)),
-                    ft.DataCell(ft.Text(s.get("comment", ""), color=text_color)),
-                    ft.DataCell(  # DELETE BUTTON
-                        ft.IconButton(
-                            icon=ft.Icons.CLOSE,
-                            icon_size=16,
-                            icon_color=ft.Colors.RED_400,
-                            tooltip="Delete spot",
-                            on_click=self._delete_spot(s),
-                        )
-                    ),
-                ],
-                color=highlight_color,
-            )
-            rows.append(row)
+    def _drop_rows(self, spots) -> bool:
+        """Remove the rows shown for these spots (if any) from the table, True if any were"""
+        removed = False
+        for s in spots:
+            self._row_cache.pop(id(s), None)
+            row = self._row_for_spot.pop(id(s), None)
+            if row is not None:
+                self.table.rows.remove(row)
+                removed = True
+        return removed
     
-        self.table.rows = rows
+    def _update_table(self):
+        """Send the current rows to the page"""
+        self._rows_dirty = False
         try:
             self.table.update()
         except:
-            pass
\ No newline at end of file
+            pass  # Control not yet added to page
+    
+    def _rebuild_rows(self):
+        """Rebuild table rows from both buffers, needed spots first - only used when filters change"""
+        # Held throughout - add_spot mutates the buffers and row cache from the
+        # message bus thread while this walks them
+        with self._rows_lock:
+            rows: list[ft.DataRow] = []
+            row_for_spot: dict[int, ft.DataRow] = {}
+        
+            # Clean old needed spots before rebuilding
+            self._clean_old_needed_spots()
+        
+            # Walk both buffers without copying them: needed spots first, then regular
+            all_spots = itertools.chain(self.needed_spots.values(), self.regular_spots)
+        
+            for s in all_spots:
+                if not self._passes_filters(s):
+                    continue
+                row = self._get_row(s)
+                row_for_spot[id(s)] = row
+                rows.append(row)
+                if len(rows) >= self.max_visible_rows:
+                    break
+        
+            # Forget rows for spots that have left both buffers
+            live = {id(s) for s in itertools.chain(self.needed_spots.values(), self.regular_spots)}
+            for key in self._row_cache.keys() - live:
+                del self._row_cache[key]
+        
+            # Rows are cached per spot, so the same row objects in the same
+            # order means the page already shows exactly this
+            old = self.table.rows
+            if not self._rows_dirty and len(old) == len(rows) and all(a is b for a, b in zip(old, rows)):
+                return
+            self.table.rows = rows
+            self._row_for_spot = row_for_spot
+            self._update_table()
+    
+    def _row_state(self, s: dict) -> tuple:
+        """The settings that change how a spot's row looks (everything else is fixed at ingest)"""
+        return (s['_call_u'] in self.watch_list, self.grid_chasing_enabled and s['_needed_ffma'])
+    
+    def _get_row(self, s: dict) -> ft.DataRow:
+        """Cached row for this spot, only rebuilt when its highlight changed"""
+        state = self._row_state(s)
+        cached = self._row_cache.get(id(s))
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        row = self._make_row(s)
+        self._row_cache[id(s)] = (state, row)
+        return row
+    
+    def _make_row(self, s: dict) -> ft.DataRow:
+        """Build the DataRow for one spot"""
+        # Needed flags were looked up once in add_spot
+        needed_challenge = s['_needed_challenge']
+        # FFMA highlight only while grid chasing is on (6m grids only)
+        needed_ffma = self.grid_chasing_enabled and s['_needed_ffma']
+        
+        # Check if callsign is on watch list (HIGHEST PRIORITY)
+        call = s.get("call", "")
+        on_watch_list = s['_call_u'] in self.watch_list
+        
+        # Determine highlight color (Watch List takes priority)
+        if on_watch_list:
+            highlight_color = ft.Colors.RED_400  # Watch List - RED URGENT!
+            text_color = ft.Colors.WHITE
+        elif needed_challenge:
+            highlight_color = ft.Colors.AMBER_200  # Challenge - amber
+            text_color = ft.Colors.BLACK
+        elif needed_ffma:
+            highlight_color = ft.Colors.CYAN_200  # FFMA - cyan
+            text_color = ft.Colors.BLACK
+        else:
+            highlight_color = None
+            text_color = None
+            
+        # Format callsign with LoTW indicator
+        call_display = _build_call_display(call, s['_lotw_state'], text_color, needed_challenge or needed_ffma)
+        
+        # Create row with appropriate background color
+        row = ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text(s.get("time", ""), color=text_color)),
+                ft.DataCell(ft.Text(s.get("band", ""), color=text_color)),
+                ft.DataCell(ft.Text(s.get("freq", ""), color=text_color)),
+                ft.DataCell(call_display),
+                ft.DataCell(ft.Text(s.get("dxcc", ""), color=text_color, weight=ft.FontWeight.BOLD if (needed_challenge or needed_ffma) else None)),
+                ft.DataCell(ft.Text(s.get("grid", ""), color=text_color)),
+                ft.DataCell(ft.Text(s.get("spotter", ""), color=text_color)),
+                ft.DataCell(ft.Text(s.get("comment", ""), color=text_color)),
+                ft.DataCell(  # DELETE BUTTON
+                    ft.IconButton(
+                        icon=ft.Icons.CLOSE,
+                        icon_size=16,
+                        icon_color=ft.Colors.RED_400,
+                        tooltip="Delete spot",
+                        on_click=self._delete_spot(s),
+                    )
+                ),
+            ],
+            color=highlight_color,
+            data=id(s),  # Back to the spot when the row is trimmed
+        )
+        return row
\ No newline at end of file
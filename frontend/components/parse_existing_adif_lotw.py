@@ -3,8 +3,13 @@ Parse existing lotwreport_challenge.adi file
 Use this if you already have the ADIF downloaded
 """
 
-from backend.lotw_challenge import parse_challenge_adif, save_challenge_data
+from backend.lotw_challenge import build_challenge_result, collect_challenge_pairs, save_challenge_data
 from pathlib import Path
+import codecs
+import re
+
+CHUNK_SIZE = 1024 * 1024  # Read/decode 1 MiB at a time
+EOR_RE = re.compile(r'<eor>', re.IGNORECASE)
 
 # Check if file exists
 adif_file = Path("lotwreport_challenge.adi")
@@ -14,14 +19,37 @@ if not adif_file.exists():
     print("Please make sure the file is in the root directory")
     exit(1)
 
-print("Reading ADIF file...")
-adif_text = adif_file.read_text(encoding='utf-8', errors='ignore')
-
-print(f"File size: {len(adif_text)} bytes")
+print(f"File size: {adif_file.stat().st_size} bytes")
 print("\nParsing Challenge data...")
 
-# Parse without existing data (fresh parse)
-challenge_data = parse_challenge_adif(adif_text, existing_data=None)
+# Stream the file instead of decoding it into one big string - each chunk's
+# complete records add to the pair sets, the partial record after the last
+# <eor> waits for the next chunk. The summary is built once at the end.
+confirmed_pairs = set()  # Fresh parse
+credited_pairs = set()
+decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+pending = ""
+
+with open(adif_file, 'rb') as f:
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        pending += decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            break
+        
+        cut = 0
+        for m in EOR_RE.finditer(pending):
+            cut = m.end()
+        if cut:
+            collect_challenge_pairs(pending[:cut], confirmed_pairs, credited_pairs)
+            pending = pending[cut:]
+
+# Whatever is left (no trailing <eor>)
+collect_challenge_pairs(pending, confirmed_pairs, credited_pairs)
+challenge_data = build_challenge_result(confirmed_pairs, credited_pairs)
+
+print(f"Total confirmed pairs: {len(confirmed_pairs)}")
+print(f"Total credited pairs: {len(credited_pairs)}")
 
 # Save
 if save_challenge_data(challenge_data):
@@ -660,7 +660,7 @@ class SettingsTab(ft.Column):
     def _download_vucc_data(self, e):
         """Download VUCC data from LoTW with progress updates"""
         logger.info("FFMA DOWNLOAD - Starting VUCC download")
-        from backend.config import get_lotw_username, get_lotw_password, set_last_vucc_update
+        from backend.config import get_lotw_username, get_lotw_password, set_last_vucc_update, get_last_vucc_update
         import threading
         
         username = get_lotw_username()
@@ -694,7 +694,14 @@ class SettingsTab(ft.Column):
                 from backend.lotw_vucc import download_and_parse_ffma
                 from datetime import datetime
                 
-                success, result = download_and_parse_ffma(username, password, progress_callback=update_progress)
+                # Get last update date for incremental download
+                last_update = get_last_vucc_update()
+                since_date = last_update.split()[0] if last_update else None
+                
+                success, result = download_and_parse_ffma(
+                    username, password, since_date,
+                    progress_callback=update_progress
+                )
                 
                 if success:
                     # Update status
@@ -49,6 +49,8 @@ class MainUI(ft.Column):
         
         self.connection_task = None
         self.solar_timer_task = None 
+        self.band_schedule_dialog = None
+        self.command_help_sheet = None  # Built on first help click, then reopened
 
         self.blocked_prefixes: set[str] = set()
         self.recent_spot_times: list[float] = []
@@ -315,8 +317,10 @@ class MainUI(ft.Column):
             
     def _show_band_schedule(self, e):
         """Show band schedule dialog"""
-        dialog = BandScheduleDialog(self.page)
-        dialog.show()
+        # Reuse one dialog - it builds its controls on first show()
+        if self.band_schedule_dialog is None:
+            self.band_schedule_dialog = BandScheduleDialog(self.page)
+        self.band_schedule_dialog.show()
 
     async def _init_lotw_data(self):
         """Download LoTW user data if needed"""  
@@ -596,7 +600,10 @@ class MainUI(ft.Column):
         """Show dialog with common commands"""
         print("DEBUG: Help button clicked!")
     
-        help_text = """Common VE7CC Cluster Commands:
+        # Static content - build the sheet once and just reopen it, instead of
+        # stacking a new one on page.overlay every click
+        if self.command_help_sheet is None:
+            help_text = """Common VE7CC Cluster Commands:
 
     FILTERS (reduce spot volume):
       set/filter doc/pass k,ve        - Only spots from US/Canada
@@ -626,30 +633,32 @@ class MainUI(ft.Column):
     Press Enter in command field or click Send to execute."""
 
         
-        def close_bs(e):
-            bs.open = False
-            self.page.update()
+            def close_bs(e):
+                bs.open = False
+                self.page.update()
     
-        bs = ft.BottomSheet(
-            content=ft.Container(
-                content=ft.Column([
-                    ft.Row([
-                    ft.Text("Cluster Commands", size=20, weight=ft.FontWeight.BOLD),
-                    ft.IconButton(icon=ft.Icons.CLOSE, on_click=close_bs),
-                ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                ft.Divider(),
-                ft.Container(
-                    content=ft.Text(help_text, selectable=True, size=13),
-                    height=500,  # Fixed height
+            bs = ft.BottomSheet(
+                content=ft.Container(
+                    content=ft.Column([
+                        ft.Row([
+                        ft.Text("Cluster Commands", size=20, weight=ft.FontWeight.BOLD),
+                        ft.IconButton(icon=ft.Icons.CLOSE, on_click=close_bs),
+                    ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                    ft.Divider(),
+                    ft.Container(
+                        content=ft.Text(help_text, selectable=True, size=13),
+                        height=500,  # Fixed height
+                    ),
+                ], scroll=ft.ScrollMode.AUTO),
+                padding=20,
+                height=600,  # Make it taller    
                 ),
-            ], scroll=ft.ScrollMode.AUTO),
-            padding=20,
-            height=600,  # Make it taller    
-            ),
-        )
+            )
     
-        self.page.overlay.append(bs)
-        bs.open = True
+            self.page.overlay.append(bs)
+            self.command_help_sheet = bs
+        
+        self.command_help_sheet.open = True
         self.page.update()
     
     def _close_dialog(self):
@@ -700,6 +709,17 @@ class MainUI(ft.Column):
                 except:
                     pass
             return
+        
+        # Batched cluster commands (list) - queue each in order
+        if mtype == "cluster_command_batch":
+            from backend.cluster_async import command_queue
+            for cmd in msg.get("data", []):
+                if cmd:
+                    try:
+                        command_queue.put_nowait(cmd)
+                    except:
+                        pass
+            return
             
         # Handle cluster responses (server output)
         if mtype == "cluster_response":
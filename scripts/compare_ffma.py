@@ -1,30 +1,23 @@
 # compare_ffma.py - 2026-01-02
 # Compare LoTW FFMA list with parsed ffma_data.json to find missing grids
 
-import json
+import mmap
+import re
 from pathlib import Path
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional - stdlib json fallback
+    from json import loads as _json_loads
+
+# "GRID CALL" lines - grid is 2 field letters (A-R) + 2 digits
+_LOTW_RE = re.compile(r'^[ \t]*([A-R]{2}\d\d)[ \t]+(\S+)', re.MULTILINE | re.IGNORECASE)
+# Key fields shown for each missing grid found in the ADIF
+_CONTEXT_FIELDS_RE = re.compile(r'<(CALL|BAND|MY_GRIDSQUARE|QSL_RCVD):\d+>([A-Z0-9]+)')
+
 def parse_lotw_list(text):
     """Parse the LoTW FFMA list and extract grids with callsigns"""
-    grids_with_calls = {}
-    
-    for line in text.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Split by tabs or spaces
-        parts = line.split()
-        if len(parts) >= 2:
-            grid = parts[0].strip()
-            call = parts[1].strip()
-            
-            # Valid grid format: 2 letters + 2 numbers
-            if len(grid) == 4 and grid[:2].isalpha() and grid[2:].isdigit():
-                if call and call != '':  # Has a callsign
-                    grids_with_calls[grid] = call
-    
-    return grids_with_calls
+    return {grid.upper(): call for grid, call in _LOTW_RE.findall(text)}
 
 def main():
     # Load the LoTW list
@@ -34,7 +27,8 @@ def main():
         print("Create this file with the LoTW FFMA grid list (grid + callsign per line)")
         return
     
-    lotw_text = lotw_file.read_text()
+    # List is plain ASCII (grids + callsigns) - skip UTF-8 decoding
+    lotw_text = lotw_file.read_bytes().decode('ascii', 'ignore')
     lotw_grids = parse_lotw_list(lotw_text)
     
     # Load ffma_data.json
@@ -43,7 +37,7 @@ def main():
         print("ERROR: ffma_data.json not found")
         return
     
-    ffma_data = json.loads(ffma_file.read_text())
+    ffma_data = _json_loads(ffma_file.read_bytes())
     parsed_grids = set(ffma_data.get("worked_grids", {}).keys())
     
     # Compare
@@ -78,39 +72,44 @@ def main():
     
     # Now search the ADIF for missing grids
     adif_file = Path("vucc_6m.adi")
-    if adif_file.exists() and missing:
+    if adif_file.exists() and adif_file.stat().st_size and missing:
         print("="*80)
         print("SEARCHING ADIF FOR MISSING GRIDS")
         print("="*80)
         
-        adif_text = adif_file.read_text(encoding='utf-8', errors='ignore').upper()
-        
-        for grid in sorted(missing):
-            # Search for this grid in ADIF
-            if f"<GRIDSQUARE:{len(grid)}>{grid}" in adif_text or f"GRIDSQUARE:6>{grid}" in adif_text:
-                print(f"\n{grid} - FOUND IN ADIF")
-                
-                # Find the record
-                grid_pos = adif_text.find(grid)
-                if grid_pos > 0:
-                    # Get surrounding context
-                    start = max(0, grid_pos - 500)
-                    end = min(len(adif_text), grid_pos + 500)
-                    context = adif_text[start:end]
-                    
-                    # Extract key fields
-                    import re
-                    my_grid_match = re.search(r'<MY_GRIDSQUARE:\d+>([A-Z0-9]+)', context)
-                    band_match = re.search(r'<BAND:\d+>([A-Z0-9]+)', context)
-                    call_match = re.search(r'<CALL:\d+>([A-Z0-9]+)', context)
-                    qsl_match = re.search(r'<QSL_RCVD:\d+>([YN])', context)
+        # Scan the file through an mmap - no full (or uppercased) copy in memory
+        with open(adif_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as adif_data:
+            # Locate every missing grid in one pass (first occurrence of each)
+            grid_re = re.compile(rb'<GRIDSQUARE:\d+>(' + b'|'.join(re.escape(g.encode()) for g in sorted(missing)) + rb')',
+                                 re.IGNORECASE)
+            found = {}
+            for match in grid_re.finditer(adif_data):
+                found.setdefault(match.group(1).decode().upper(), match.start(1))
+            
+            for grid in sorted(missing):
+                # Search for this grid in ADIF
+                if grid in found:
+                    print(f"\n{grid} - FOUND IN ADIF")
                     
-                    print(f"  CALL: {call_match.group(1) if call_match else '?'}")
-                    print(f"  BAND: {band_match.group(1) if band_match else '?'}")
-                    print(f"  MY_GRIDSQUARE: {my_grid_match.group(1) if my_grid_match else '?'}")
-                    print(f"  QSL_RCVD: {qsl_match.group(1) if qsl_match else '?'}")
-            else:
-                print(f"\n{grid} - NOT FOUND IN ADIF (might be paper QSL)")
+                    # Find the record
+                    grid_pos = found[grid]
+                    if grid_pos > 0:
+                        # Get surrounding context
+                        start = max(0, grid_pos - 500)
+                        end = min(len(adif_data), grid_pos + 500)
+                        context = adif_data[start:end].decode('utf-8', errors='ignore').upper()
+                        
+                        # Extract key fields (first occurrence of each)
+                        fields = {}
+                        for name, value in _CONTEXT_FIELDS_RE.findall(context):
+                            fields.setdefault(name, value)
+                        
+                        print(f"  CALL: {fields.get('CALL', '?')}")
+                        print(f"  BAND: {fields.get('BAND', '?')}")
+                        print(f"  MY_GRIDSQUARE: {fields.get('MY_GRIDSQUARE', '?')}")
+                        print(f"  QSL_RCVD: {fields.get('QSL_RCVD', '?')}")
+                else:
+                    print(f"\n{grid} - NOT FOUND IN ADIF (might be paper QSL)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,8 +6,59 @@ Creates dxcc_entities.json with all entities for verification
 
 import json
 import re
+from bisect import bisect_right
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:  # optional - stdlib json fallback
+    orjson = None
+
+# Prefix without explicit DXCC (use default): prefix[cq]<itu>
+_SIMPLE_RE = re.compile(r'\s+([A-Z0-9/]+)[\[<,]')
+
+# Characters allowed in a prefix/callsign
+_PREFIX_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789/')
+
+
+def _iter_dxcc_prefixes(text):
+    """
+    Yield (prefix, dxcc, offset) for each prefix with explicit DXCC number
+    Format: =prefix(123) or prefix(123) - scanned with str.find, no regex
+    """
+    start = 0
+    while (lp := text.find('(', start)) != -1:
+        rp = text.find(')', lp)
+        if rp == -1:
+            return
+        
+        number = text[lp + 1:rp]
+        if not (number.isascii() and number.isdigit()):
+            start = lp + 1
+            continue
+        
+        # Walk back from '(' over prefix characters (not past previous match)
+        j = lp
+        while j > start and text[j - 1] in _PREFIX_CHARS:
+            j -= 1
+        
+        if j < lp:
+            yield text[j:lp], number, j
+            start = rp + 1
+        else:
+            start = lp + 1
+
+
+def _iter_records(filename, chunk_size=65536):
+    """Yield cty.dat records (text between ';') without loading the whole file"""
+    buf = ''
+    with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            buf += chunk
+            *records, buf = buf.split(';')
+            yield from records
+    yield buf
 
 
 def parse_cty_dat(filename="cty.dat"):
@@ -24,24 +75,18 @@ def parse_cty_dat(filename="cty.dat"):
     
     entities = {}
     
-    with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-    
-    # Split by record (ends with ;)
-    records = content.split(';')
-    
-    print(f"Processing {len(records)} records from cty.dat...")
+    print(f"Processing records from {filename}...")
     
-    for record in records:
-        if not record.strip():
+    # Records end with ;
+    for record in _iter_records(filename):
+        record = record.strip()
+        if not record:
             continue
         
         # First line has: Country Name:CQ:ITU:Continent:Lat:Long:TZ:Primary Prefix
-        lines = record.strip().split('\n')
-        if not lines:
-            continue
-        
-        header = lines[0].strip()
+        # Rest of the record is the prefix body
+        header, _, body = record.partition('\n')
+        header = header.strip()
         
         # Parse header
         parts = header.split(':')
@@ -59,22 +104,23 @@ def parse_cty_dat(filename="cty.dat"):
         # We want the (dxcc) number
         
         dxcc_numbers = set()
-        all_prefixes = []
+        found = []  # (line, kind, offset, prefix)
+        newlines = [m.start() for m in re.finditer('\n', body)]
         
-        for line in lines[1:]:
-            # Find all prefixes with DXCC numbers
-            # Pattern: =prefix(123) or just prefix(123)
-            matches = re.findall(r'[=]?([A-Z0-9/]+)\((\d+)\)', line)
-            for prefix, dxcc in matches:
-                dxcc_numbers.add(int(dxcc))
-                all_prefixes.append(prefix)
-            
-            # Also look for prefixes without explicit DXCC (use default)
-            # These will be in format: prefix[cq]<itu>
-            simple_matches = re.findall(r'\s+([A-Z0-9/]+)[\[<,]', line)
-            for prefix in simple_matches:
-                if prefix not in all_prefixes:
-                    all_prefixes.append(prefix)
+        # Scan the whole prefix body once (everything after the header line)
+        # Find all prefixes with DXCC numbers
+        for prefix, dxcc, offset in _iter_dxcc_prefixes(body):
+            dxcc_numbers.add(int(dxcc))
+            found.append((bisect_right(newlines, offset), 0, offset, prefix))
+        
+        # Also look for prefixes without explicit DXCC (use default)
+        for m in _SIMPLE_RE.finditer(body):
+            found.append((bisect_right(newlines, m.start(1)), 1, m.start(1), m.group(1)))
+        
+        # Same order as scanning line by line (explicit DXCC prefixes first on
+        # each line) - create_master_list only keeps the first 10
+        found.sort()
+        all_prefixes = dict.fromkeys(f[3] for f in found)  # insertion-ordered set
         
         # Store each DXCC number found
         for dxcc in dxcc_numbers:
@@ -85,13 +131,11 @@ def parse_cty_dat(filename="cty.dat"):
                     "cq_zone": cq_zone,
                     "itu_zone": itu_zone,
                     "continent": continent,
-                    "all_prefixes": []
+                    "all_prefixes": {}
                 }
             
             # Add any new prefixes
-            for p in all_prefixes:
-                if p not in entities[dxcc]["all_prefixes"]:
-                    entities[dxcc]["all_prefixes"].append(p)
+            entities[dxcc]["all_prefixes"].update(all_prefixes)
     
     print(f"Extracted {len(entities)} unique DXCC entities")
     return entities
@@ -132,7 +176,7 @@ def create_master_list(entities):
             "itu_zone": data["itu_zone"],
             "deleted": is_deleted,
             "current": not is_deleted,
-            "all_prefixes": data["all_prefixes"][:10],  # Limit to first 10
+            "all_prefixes": list(data["all_prefixes"])[:10],  # Limit to first 10
         }
         
         if is_deleted:
@@ -149,8 +193,11 @@ def create_master_list(entities):
 
 def save_master_list(master, filename="dxcc_entities.json"):
     """Save master list to JSON file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(master, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        Path(filename).write_bytes(orjson.dumps(master, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(master, f, indent=2, ensure_ascii=False)
     print(f"\nSaved master list to {filename}")
 
 
@@ -183,18 +230,22 @@ def create_stats_report(master):
     print("DXCC EXTRACTION STATISTICS")
     print("="*80)
     
-    current = [d for d in master.values() if d["current"]]
-    deleted = [d for d in master.values() if d["deleted"]]
+    # Split current/deleted and count continents in one pass
+    current = []
+    deleted = []
+    continents = Counter()
+    for entity in master.values():
+        if entity["current"]:
+            current.append(entity)
+            continents[entity["continent"]] += 1
+        if entity["deleted"]:
+            deleted.append(entity)
     
     print(f"\nTotal entities extracted: {len(master)}")
     print(f"Marked as CURRENT: {len(current)} (target: 340)")
     print(f"Marked as DELETED: {len(deleted)}")
     
     print("\nBy Continent (CURRENT only):")
-    continents = defaultdict(int)
-    for entity in current:
-        continents[entity["continent"]] += 1
-    
     for cont in sorted(continents.keys()):
         print(f"  {cont}: {continents[cont]}")
     